@@ -31,8 +31,8 @@ def convert_worker(input_path, output_path, config, pid_queue, log_queue, lang_c
         if lang_code:
             logging.info(f"[{Path(input_path).name}] Language: {lang_code}")
         
-        converter = ExcelConverter(config)
-        converter.convert(input_path, output_path, pid_queue)
+        with ExcelConverter(config) as converter:
+            converter.convert(input_path, output_path, pid_queue)
     except Exception:
         # Errors are logged in converter, but we raise to signal failure to parent
         raise
@@ -1,22 +1,36 @@
-import win32com.client
-import win32com, shutil
+import sys
+# Join the multithreaded apartment (COINIT_MULTITHREADED = 0). Excel runs out of process,
+# so calls are marshalled either way, but an MTA thread needs no message pump and several
+# converter threads can each drive their own Excel. Must be set before pythoncom is imported.
+# pywin32 (win32com, pythoncom, win32process) is imported inside the functions that use it,
+# so importing this module (e.g. in the main process) does not load it or initialize COM.
+sys.coinit_flags = 0
+import shutil
 from pathlib import Path
-import pythoncom
-import win32process
 import os
 import logging
 import tempfile
 import stat
 import time
 import ctypes
+import threading
+import queue
+import contextlib
+import gc
+from types import MappingProxyType
+from collections import namedtuple
+import psutil
 from .utils import ensure_dir
 from .pdf_trimmer import PDFTrimmer
+from .print_options import PrintOptions
 
 # Excel Constants
 xlTypePDF = 0
 xlQualityStandard = 0
+xlQualityMinimum = 1
 xlLandscape = 2
 xlPortrait = 1
+xlCalculationManual = -4135
 
 # Paper Size Constants (Excel xlPaperSize enumeration)
 # All paper sizes supported by Microsoft Print to PDF
@@ -74,129 +88,698 @@ PRINT_MODE_AUTO_PAGE_SIZE = "auto_page_size"
 PRINT_MODE_NATIVE_PRINT = "native_print"
 PRINT_MODE_UNIFORM_PAGE_SIZE = "uniform_page_size"
 
+# Print options used when list-format print_options has no entry matching a sheet
+# Shared by every unmatched sheet, so it must not be modified
+_DEFAULT_PRINT_OPTIONS = PrintOptions({
+    'mode': PRINT_MODE_AUTO,
+    'page_size': 'auto',
+    'orientation': 'auto',
+    'scaling': 'fit_columns',
+    'scaling_percent': 100,
+    'margins': 'normal',
+    'print_header_footer': True,
+    'print_row_col_headings': False
+})
+
+# COM error returned when a thread was already initialized with a different apartment model
+RPC_E_CHANGED_MODE = -2147417850
+
+# COM error returned when Excel is busy (e.g. a modal dialog is open) and rejects the call
+RPC_E_CALL_REJECTED = -2147418111
+
+# Seconds to wait for Excel to exit after Quit() before killing the process
+EXCEL_QUIT_TIMEOUT = 5
+
+# Seconds ExcelPool.acquire() waits for a free Excel instance before raising queue.Empty
+EXCEL_POOL_ACQUIRE_TIMEOUT = 600
+
+# excel.pdf_quality config values -> ExportAsFixedFormat Quality
+PDF_QUALITIES = MappingProxyType({
+    "standard": xlQualityStandard,
+    "minimum": xlQualityMinimum,
+})
+
+# Per-thread COM initialization state (COM init is per-thread and costly to repeat)
+_com_state = threading.local()
+
+# PageSetup header/footer section properties
+HEADER_FOOTER_SECTIONS = ("LeftHeader", "CenterHeader", "RightHeader", "LeftFooter", "CenterFooter", "RightFooter")
+
+# One PAGE_SIZES entry: dimensions in points plus the Excel xlPaperSize constant
+PageSize = namedtuple('PageSize', 'width height printable_height xl_const')
+
 # Page sizes in points (1 inch = 72 points, 1 cm = 28.35 points)
 # These are printable area estimates (minus typical margins)
 # All paper sizes supported by Microsoft Print to PDF
-PAGE_SIZES = {
-    "LETTER": {"width": 612, "height": 792, "printable_height": 700, "xl_const": xlPaperLetter},
-    "LETTER_SMALL": {"width": 612, "height": 792, "printable_height": 700, "xl_const": xlPaperLetterSmall},
-    "TABLOID": {"width": 792, "height": 1224, "printable_height": 1130, "xl_const": xlPaperTabloid},
-    "LEDGER": {"width": 1224, "height": 792, "printable_height": 700, "xl_const": xlPaperLedger},
-    "LEGAL": {"width": 612, "height": 1008, "printable_height": 915, "xl_const": xlPaperLegal},
-    "STATEMENT": {"width": 396, "height": 612, "printable_height": 520, "xl_const": xlPaperStatement},
-    "EXECUTIVE": {"width": 522, "height": 756, "printable_height": 665, "xl_const": xlPaperExecutive},
-    "FOLIO": {"width": 612, "height": 936, "printable_height": 845, "xl_const": xlPaperFolio},
-    "QUARTO": {"width": 610, "height": 780, "printable_height": 690, "xl_const": xlPaperQuarto},
-    "10X14": {"width": 720, "height": 1008, "printable_height": 915, "xl_const": xlPaper10x14},
-    "11X17": {"width": 792, "height": 1224, "printable_height": 1130, "xl_const": xlPaper11x17},
-    "NOTE": {"width": 612, "height": 792, "printable_height": 700, "xl_const": xlPaperNote},
-    "ENVELOPE_9": {"width": 279, "height": 639, "printable_height": 550, "xl_const": xlPaperEnvelope9},
-    "ENVELOPE_10": {"width": 297, "height": 684, "printable_height": 595, "xl_const": xlPaperEnvelope10},
-    "ENVELOPE_11": {"width": 324, "height": 747, "printable_height": 660, "xl_const": xlPaperEnvelope11},
-    "ENVELOPE_12": {"width": 342, "height": 792, "printable_height": 700, "xl_const": xlPaperEnvelope12},
-    "ENVELOPE_14": {"width": 360, "height": 828, "printable_height": 735, "xl_const": xlPaperEnvelope14},
-    "ENVELOPE_DL": {"width": 312, "height": 624, "printable_height": 535, "xl_const": xlPaperEnvelopeDL},
-    "ENVELOPE_C3": {"width": 918, "height": 1296, "printable_height": 1205, "xl_const": xlPaperEnvelopeC3},
-    "ENVELOPE_C4": {"width": 649, "height": 918, "printable_height": 830, "xl_const": xlPaperEnvelopeC4},
-    "ENVELOPE_C5": {"width": 459, "height": 649, "printable_height": 560, "xl_const": xlPaperEnvelopeC5},
-    "ENVELOPE_C6": {"width": 323, "height": 459, "printable_height": 370, "xl_const": xlPaperEnvelopeC6},
-    "ENVELOPE_C65": {"width": 323, "height": 649, "printable_height": 560, "xl_const": xlPaperEnvelopeC65},
-    "ENVELOPE_B4": {"width": 709, "height": 1001, "printable_height": 910, "xl_const": xlPaperEnvelopeB4},
-    "ENVELOPE_B5": {"width": 499, "height": 709, "printable_height": 620, "xl_const": xlPaperEnvelopeB5},
-    "ENVELOPE_B6": {"width": 354, "height": 499, "printable_height": 410, "xl_const": xlPaperEnvelopeB6},
-    "ENVELOPE_MONARCH": {"width": 279, "height": 540, "printable_height": 450, "xl_const": xlPaperEnvelopeMonarch},
+PAGE_SIZES = MappingProxyType({
+    "LETTER": PageSize(612, 792, 700, xlPaperLetter),
+    "LETTER_SMALL": PageSize(612, 792, 700, xlPaperLetterSmall),
+    "TABLOID": PageSize(792, 1224, 1130, xlPaperTabloid),
+    "LEDGER": PageSize(1224, 792, 700, xlPaperLedger),
+    "LEGAL": PageSize(612, 1008, 915, xlPaperLegal),
+    "STATEMENT": PageSize(396, 612, 520, xlPaperStatement),
+    "EXECUTIVE": PageSize(522, 756, 665, xlPaperExecutive),
+    "FOLIO": PageSize(612, 936, 845, xlPaperFolio),
+    "QUARTO": PageSize(610, 780, 690, xlPaperQuarto),
+    "10X14": PageSize(720, 1008, 915, xlPaper10x14),
+    "11X17": PageSize(792, 1224, 1130, xlPaper11x17),
+    "NOTE": PageSize(612, 792, 700, xlPaperNote),
+    "ENVELOPE_9": PageSize(279, 639, 550, xlPaperEnvelope9),
+    "ENVELOPE_10": PageSize(297, 684, 595, xlPaperEnvelope10),
+    "ENVELOPE_11": PageSize(324, 747, 660, xlPaperEnvelope11),
+    "ENVELOPE_12": PageSize(342, 792, 700, xlPaperEnvelope12),
+    "ENVELOPE_14": PageSize(360, 828, 735, xlPaperEnvelope14),
+    "ENVELOPE_DL": PageSize(312, 624, 535, xlPaperEnvelopeDL),
+    "ENVELOPE_C3": PageSize(918, 1296, 1205, xlPaperEnvelopeC3),
+    "ENVELOPE_C4": PageSize(649, 918, 830, xlPaperEnvelopeC4),
+    "ENVELOPE_C5": PageSize(459, 649, 560, xlPaperEnvelopeC5),
+    "ENVELOPE_C6": PageSize(323, 459, 370, xlPaperEnvelopeC6),
+    "ENVELOPE_C65": PageSize(323, 649, 560, xlPaperEnvelopeC65),
+    "ENVELOPE_B4": PageSize(709, 1001, 910, xlPaperEnvelopeB4),
+    "ENVELOPE_B5": PageSize(499, 709, 620, xlPaperEnvelopeB5),
+    "ENVELOPE_B6": PageSize(354, 499, 410, xlPaperEnvelopeB6),
+    "ENVELOPE_MONARCH": PageSize(279, 540, 450, xlPaperEnvelopeMonarch),
     # Note: A1 and A2 not reliably supported - use Architecture sizes or A3 instead
-    # "A1": {"width": 1684, "height": 2384, "printable_height": 2290, "xl_const": 67},
-    # "A2": {"width": 1191, "height": 1684, "printable_height": 1590, "xl_const": 66},
-    "A3": {"width": 842, "height": 1191, "printable_height": 1100, "xl_const": xlPaperA3},
-    "A4": {"width": 595, "height": 842, "printable_height": 750, "xl_const": xlPaperA4},
-    "A4_SMALL": {"width": 595, "height": 842, "printable_height": 750, "xl_const": xlPaperA4Small},
-    "A5": {"width": 420, "height": 595, "printable_height": 505, "xl_const": xlPaperA5},
-    "A6": {"width": 298, "height": 420, "printable_height": 330, "xl_const": xlPaperA6},
-    "B4": {"width": 729, "height": 1032, "printable_height": 940, "xl_const": xlPaperB4},
-    "B5": {"width": 516, "height": 729, "printable_height": 640, "xl_const": xlPaperB5},
-    "B6": {"width": 363, "height": 516, "printable_height": 425, "xl_const": xlPaperEnvelopeB6},
+    # "A1": PageSize(1684, 2384, 2290, 67),
+    # "A2": PageSize(1191, 1684, 1590, 66),
+    "A3": PageSize(842, 1191, 1100, xlPaperA3),
+    "A4": PageSize(595, 842, 750, xlPaperA4),
+    "A4_SMALL": PageSize(595, 842, 750, xlPaperA4Small),
+    "A5": PageSize(420, 595, 505, xlPaperA5),
+    "A6": PageSize(298, 420, 330, xlPaperA6),
+    "B4": PageSize(729, 1032, 940, xlPaperB4),
+    "B5": PageSize(516, 729, 640, xlPaperB5),
+    "B6": PageSize(363, 516, 425, xlPaperEnvelopeB6),
     # Large Format Engineering Sizes (C/D/E Sheet) - Fully supported by Microsoft Print to PDF
-    "C_SHEET": {"width": 1224, "height": 1584, "printable_height": 1490, "xl_const": xlPaperCSheet},
-    "D_SHEET": {"width": 1584, "height": 2448, "printable_height": 2355, "xl_const": xlPaperDSheet},
-    "E_SHEET": {"width": 2448, "height": 3168, "printable_height": 3075, "xl_const": xlPaperESheet}
-}
+    "C_SHEET": PageSize(1224, 1584, 1490, xlPaperCSheet),
+    "D_SHEET": PageSize(1584, 2448, 2355, xlPaperDSheet),
+    "E_SHEET": PageSize(2448, 3168, 3075, xlPaperESheet)
+})
+
+# Reverse index: Excel paper size constant -> page size info
+# When several names share a constant, the first one listed above wins
+_PAGE_SIZES_BY_CONST = {}
+for _size_info in PAGE_SIZES.values():
+    _PAGE_SIZES_BY_CONST.setdefault(_size_info.xl_const, _size_info)
+del _size_info
+
+# PAGE_SIZES sorted by area (smallest first), for picking the smallest page that fits
+_PAGE_SIZES_BY_AREA = tuple(sorted(PAGE_SIZES.items(), key=lambda item: item[1].width * item[1].height))
+
+def _page_size_info(page_size_upper):
+    """
+    Returns (name, PageSize) for an upper-cased page size name, falling back to A4 for unknown names.
+    """
+    page_info = PAGE_SIZES.get(page_size_upper)
+    if page_info is None:
+        return "A4", PAGE_SIZES["A4"]
+    return page_size_upper, page_info
+
+# 1 cm = 28.35 points
+CM_TO_POINTS = 28.35
+
+# Predefined margin presets in centimeters (matching Excel exactly)
+MARGIN_PRESETS = MappingProxyType({
+    'normal': {'top': 1.91, 'bottom': 1.91, 'left': 1.78, 'right': 1.78, 'header': 0.76, 'footer': 0.76},
+    'wide': {'top': 2.54, 'bottom': 2.54, 'left': 2.54, 'right': 2.54, 'header': 1.27, 'footer': 1.27},
+    'narrow': {'top': 1.91, 'bottom': 1.91, 'left': 0.64, 'right': 0.64, 'header': 0.76, 'footer': 0.76}
+})
+
+# Margin config keys and the PageSetup properties they set, in write order
+_MARGIN_PROPERTIES = (
+    ('top', 'TopMargin'),
+    ('bottom', 'BottomMargin'),
+    ('left', 'LeftMargin'),
+    ('right', 'RightMargin'),
+    ('header', 'HeaderMargin'),
+    ('footer', 'FooterMargin'),
+)
+
+def _margins_to_points(margins_cm):
+    """
+    Converts a margins dict in centimeters into PageSetup margin properties in points.
+    Margins missing from the dict use the 'normal' preset.
+    """
+    normal = MARGIN_PRESETS['normal']
+    return {prop: margins_cm.get(key, normal[key]) * CM_TO_POINTS for key, prop in _MARGIN_PROPERTIES}
+
+# MARGIN_PRESETS already converted to points, so presets cost no arithmetic per sheet
+_MARGIN_PRESETS_POINTS = MappingProxyType({name: _margins_to_points(m) for name, m in MARGIN_PRESETS.items()})
+
+def _clear_gen_py_cache():
+    """
+    Removes the win32com gen_py cache and forgets any generated modules already imported.
+    """
+    import win32com.client
+    
+    # Locate the gen_py cache directory
+    gen_path = Path(win32com.__gen_path__)
+    # Remove the problem gen_py cache directory
+    shutil.rmtree(gen_path, ignore_errors=True)
+    for module_name in [name for name in sys.modules if name.startswith('win32com.gen_py.')]:
+        del sys.modules[module_name]
+    win32com.client.gencache.Rebuild(verbose=0)
+
+def _early_bind(excel):
+    """
+    Wraps a started Excel instance in win32com's generated (early-bound) classes so
+    property access goes through the type library instead of IDispatch name lookups.
+    The makepy module is generated once and then reused from the gen_py cache. A corrupt
+    cache (AttributeError while loading it) is wiped and regenerated once; if that still
+    fails, the late-bound instance is returned unchanged.
+    """
+    import win32com.client
+    
+    try:
+        return win32com.client.gencache.EnsureDispatch(excel)
+    except AttributeError:
+        logging.warning("gen_py cache looks corrupt, regenerating Excel type library wrappers")
+        try:
+            _clear_gen_py_cache()
+            return win32com.client.gencache.EnsureDispatch(excel)
+        except Exception as e:
+            logging.warning(f"Could not regenerate early-bound Excel wrappers, using late binding: {e}")
+            return excel
+    except Exception as e:
+        logging.warning(f"Could not generate early-bound Excel wrappers, using late binding: {e}")
+        return excel
+
+def _ensure_com_initialized():
+    """
+    Initializes COM (multithreaded apartment) for the calling thread once.
+    Later calls on the same thread are no-ops. If the thread already joined a
+    single-threaded apartment (e.g. a GUI thread), it joins that STA instead.
+    """
+    if getattr(_com_state, 'initialized', False):
+        return
+    import pythoncom
+    
+    try:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        _com_state.mta = True
+    except pythoncom.com_error as e:
+        if e.hresult != RPC_E_CHANGED_MODE:
+            raise
+        pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+        _com_state.mta = False
+    _com_state.initialized = True
+
+def _require_com_mta():
+    """
+    Initializes COM for the calling thread and raises RuntimeError if the thread is in a
+    single-threaded apartment. Pooled Excel instances are shared between threads, which
+    only works from the multithreaded apartment.
+    """
+    _ensure_com_initialized()
+    if not getattr(_com_state, 'mta', False):
+        raise RuntimeError("ExcelPool needs COM in the multithreaded apartment, but this thread is in a single-threaded apartment")
+
+def _uninitialize_com():
+    """
+    Releases COM for the calling thread if it was initialized by _ensure_com_initialized().
+    """
+    if not getattr(_com_state, 'initialized', False):
+        return
+    import pythoncom
+    
+    pythoncom.CoUninitialize()
+    _com_state.initialized = False
+
+def _acquire_com():
+    """
+    Registers one more COM user on the calling thread (a converter driving its own Excel,
+    or an ExcelPool), initializing COM if it is not initialized yet. Pair with _release_com().
+    """
+    users = getattr(_com_state, 'users', 0)
+    if users == 0:
+        # Only uninitialize later what the registered users themselves initialized
+        _com_state.owned = not getattr(_com_state, 'initialized', False)
+        _ensure_com_initialized()
+    _com_state.users = users + 1
+
+def _release_com():
+    """
+    Drops one _acquire_com() registration. COM is uninitialized when the last user
+    on the thread lets go, and only if _acquire_com() initialized it (not the caller).
+    """
+    users = getattr(_com_state, 'users', 0)
+    if users == 0:
+        return
+    _com_state.users = users - 1
+    if users == 1 and getattr(_com_state, 'owned', False):
+        _com_state.owned = False
+        _uninitialize_com()
+
+def _used_range_size(sheet):
+    """Return (width, height) of the sheet's UsedRange in points, reading UsedRange once."""
+    used = sheet.UsedRange
+    return used.Width, used.Height
+
+def _row_heights(used_range, row_count):
+    """
+    Returns the height in points of each of the first row_count rows of used_range.
+    RowHeight on a multi-row range reads as one value when every row has the same
+    height (None otherwise), so uniform sheets need a single COM call; mixed sheets
+    fall back to one Height read per row. A row whose height cannot be read is None.
+    """
+    uniform_height = used_range.RowHeight
+    if uniform_height is not None:
+        return [uniform_height] * row_count
+    
+    rows = used_range.Rows
+    heights = []
+    for i in range(1, row_count + 1):
+        try:
+            heights.append(rows(i).Height)
+        except Exception as e:
+            logging.warning(f"Could not read height of row {i}: {e}")
+            heights.append(None)
+    return heights
+
+def _apply_pagesetup(ps, **properties):
+    """
+    Assigns several PageSetup properties, in the given order, through one resolved PageSetup object.
+    A property that already holds the value is not written again: reads are cheap, while every
+    PageSetup write makes Excel re-validate the page layout.
+    """
+    for name, value in properties.items():
+        try:
+            if getattr(ps, name) == value:
+                continue
+        except Exception:
+            pass
+        setattr(ps, name, value)
+
+@contextlib.contextmanager
+def _print_communication_deferred(excel):
+    """
+    Turns off Application.PrintCommunication for the duration of a block of PageSetup
+    writes, so Excel negotiates with the printer driver once when it is turned back on
+    instead of on every property set. Excel versions without PrintCommunication just
+    run the block as-is. Nested blocks leave it to the outermost one to turn it back on.
+    """
+    deferred = False
+    try:
+        if excel.PrintCommunication:
+            excel.PrintCommunication = False
+            deferred = True
+    except Exception:
+        pass
+    try:
+        yield
+    finally:
+        if deferred:
+            try:
+                excel.PrintCommunication = True
+            except Exception as e:
+                logging.warning(f"Could not re-enable printer communication: {e}")
+
+@contextlib.contextmanager
+def _excel_fast_mode(excel):
+    """
+    Turns off screen updating, automatic recalculation and workbook events for the
+    duration of a block, so layout changes don't trigger repaints, recalcs or event
+    macros, and restores the previous settings afterwards. Calculation can only be
+    changed while a workbook is open. Settings Excel refuses to change are left as-is.
+    """
+    fast_settings = (("ScreenUpdating", False), ("Calculation", xlCalculationManual), ("EnableEvents", False))
+    previous = []
+    for name, value in fast_settings:
+        try:
+            current = getattr(excel, name)
+            if current != value:
+                setattr(excel, name, value)
+                previous.append((name, current))
+        except Exception as e:
+            logging.debug(f"Could not change Application.{name}: {e}")
+    try:
+        yield
+    finally:
+        for name, value in reversed(previous):
+            try:
+                setattr(excel, name, value)
+            except Exception as e:
+                logging.warning(f"Could not restore Application.{name}: {e}")
+
+def _hide_page_breaks(sheet):
+    """
+    Turns off a sheet's page break display, which otherwise makes Excel repaginate
+    after every HPageBreaks/VPageBreaks.Add. Not restored: workbooks are closed without saving.
+    """
+    try:
+        if sheet.DisplayPageBreaks:
+            sheet.DisplayPageBreaks = False
+    except Exception as e:
+        logging.debug(f"Could not turn off page break display: {e}")
+
+def _file_size(path):
+    """
+    Returns the size of a file in bytes, or 0 if it does not exist (one stat call).
+    """
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+def _reap_excel(pid, timeout=EXCEL_QUIT_TIMEOUT):
+    """
+    Makes sure an Excel process is gone after Quit(). Excel stays alive while any
+    COM reference to it is still held, so the caller must drop its references first.
+    Waits up to timeout seconds for the process to exit, then kills it; with
+    timeout=0 the process is killed right away.
+    """
+    # Release COM wrappers that are only kept alive by reference cycles
+    gc.collect()
+    if not pid:
+        return
+    try:
+        process = psutil.Process(pid)
+        if timeout:
+            try:
+                process.wait(timeout=timeout)
+                return
+            except psutil.TimeoutExpired:
+                logging.warning(f"Excel process {pid} did not exit after Quit, killing it")
+        process.kill()
+    except psutil.NoSuchProcess:
+        pass
+    except Exception as e:
+        logging.warning(f"Could not terminate Excel process {pid}: {e}")
+
+def _excel_is_reusable(excel):
+    """
+    Returns True if an Excel instance still answers and has no workbooks left open,
+    so it can take the next conversion. False after a crash, a server error or a modal dialog.
+    """
+    import pythoncom
+    
+    try:
+        return excel.Workbooks.Count == 0
+    except pythoncom.com_error as e:
+        if e.hresult == RPC_E_CALL_REJECTED:
+            logging.warning("Excel instance rejected the call (busy or showing a dialog)")
+        return False
+    except Exception:
+        return False
+
+def _start_excel():
+    """
+    Starts a new, hidden Excel.Application with alerts off and the PDF printer selected.
+    Returns (excel, pid); pid is None if the process id could not be read.
+    COM must already be initialized on the calling thread.
+    """
+    import win32com.client
+    import win32process
+    
+    # Force new instance for isolation
+    excel = _early_bind(win32com.client.DispatchEx("Excel.Application"))
+    excel.Visible = False
+    excel.DisplayAlerts = False
+    
+    # Set default printer to "Microsoft Print to PDF" to avoid printer selection dialogs
+    try:
+        # Get current printer first to understand the format
+        current_printer = excel.ActivePrinter
+        logging.info(f"Current printer: {current_printer}")
+        
+        # Try multiple formats for Microsoft Print to PDF
+        printer_names = [
+            "Microsoft Print to PDF on Ne00:",
+            "Microsoft Print to PDF on Ne01:",
+            "Microsoft Print to PDF on Ne02:", 
+            "Microsoft Print to PDF on Ne03:",
+            "Microsoft Print to PDF on Ne04:",
+            "Microsoft Print to PDF on FILE:",
+            "Microsoft Print to PDF"
+        ]
+        
+        printer_set = False
+        for printer_name in printer_names:
+            try:
+                excel.ActivePrinter = printer_name
+                logging.info(f"Successfully set printer to: {printer_name}")
+                printer_set = True
+                break
+            except:
+                continue
+        
+        if not printer_set:
+            logging.warning("Could not set Microsoft Print to PDF. Using system default printer.")
+                
+    except Exception as e:
+        logging.warning(f"Could not access printer settings: {e}. Continuing with system default.")
+
+    pid = None
+    try:
+        _, pid = win32process.GetWindowThreadProcessId(excel.Hwnd)
+    except Exception as e:
+        logging.warning(f"Failed to get Excel PID: {e}")
+
+    return excel, pid
+
+class ExcelPool:
+    """
+    Hands out pre-started Excel.Application instances to converter threads and
+    takes them back after each workbook, so Excel start-up is paid once per instance.
+    Instances are shared between threads, which relies on COM running in the
+    multithreaded apartment (see sys.coinit_flags above); the pool refuses to start on,
+    or hand instances to, a thread in a single-threaded apartment. Close the pool on the
+    thread that created it.
+    """
+    def __init__(self, size=1):
+        self.size = size
+        self._idle = queue.Queue(maxsize=size)
+        self._pids = {}
+        # Instances discarded by release() whose replacement could not be started yet
+        self._missing = 0
+        self._lock = threading.Lock()
+        _acquire_com()
+        try:
+            _require_com_mta()
+        except:
+            _release_com()
+            raise
+        self._com_acquired = True
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _spawn(self):
+        excel, pid = _start_excel()
+        self._pids[id(excel)] = pid
+        return excel
+
+    def _discard(self, excel, kill=False):
+        """
+        Quits a pooled instance and waits for its process to exit. With kill=True
+        (an unhealthy instance the caller still holds references to, which would keep
+        it alive through Quit) the process is killed by PID right away instead.
+        """
+        pid = self._pids.pop(id(excel), None)
+        if kill and pid:
+            _reap_excel(pid, timeout=0)
+            return
+        try:
+            excel.Quit()
+        except:
+            pass
+        del excel
+        _reap_excel(pid)
+
+    def get_pid(self, excel):
+        """
+        Returns the process id of a pooled Excel instance, or None if unknown.
+        """
+        return self._pids.get(id(excel))
+
+    def acquire(self, timeout=EXCEL_POOL_ACQUIRE_TIMEOUT):
+        """
+        Takes an idle Excel instance from the pool, waiting up to timeout seconds (forever if None).
+        An instance lost because release() could not start its replacement is started here first.
+        Raises queue.Empty if no instance becomes free in time.
+        """
+        with self._lock:
+            respawn = self._missing > 0
+            if respawn:
+                self._missing -= 1
+        if respawn:
+            try:
+                return self._spawn()
+            except Exception as e:
+                with self._lock:
+                    self._missing += 1
+                logging.error(f"Could not start replacement Excel instance: {e}")
+        return self._idle.get(timeout=timeout)
+
+    def release(self, excel):
+        """
+        Returns an Excel instance to the pool. An instance that still has workbooks open
+        or no longer answers is quit and replaced with a fresh one.
+        """
+        if not _excel_is_reusable(excel):
+            logging.warning("Pooled Excel instance is not reusable, starting a replacement")
+            self._discard(excel, kill=True)
+            try:
+                excel = self._spawn()
+            except Exception as e:
+                # Counted so the next acquire() retries instead of the pool shrinking for good
+                logging.error(f"Could not start replacement Excel instance, retrying on next acquire: {e}")
+                with self._lock:
+                    self._missing += 1
+                return
+        self._idle.put(excel)
+
+    def close(self):
+        """
+        Quits every idle Excel instance in the pool and releases the COM initialized for it
+        on the calling thread.
+        """
+        while True:
+            try:
+                # Hand the instance straight to _discard so no local keeps Excel alive
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        if self._com_acquired:
+            self._com_acquired = False
+            _release_com()
 
 class ExcelConverter:
-    def __init__(self, config):
+    """
+    Converts Excel workbooks to PDF through a single Excel.Application instance.
+    The instance is started on the first conversion and reused for later ones;
+    call close() (or use the converter as a context manager) to quit Excel.
+    When an ExcelPool is given, each conversion borrows an instance from the pool instead.
+    """
+    def __init__(self, config, excel_pool=None):
         self.config = config
         self.pdf_trimmer = PDFTrimmer(config)
+        self._excel = None
+        self._excel_pid = None
+        self._excel_pool = excel_pool
+        # Set once this converter has registered itself as a COM user for its own Excel
+        self._com_acquired = False
+        # Skip unhiding rows/columns and expanding groups (for files known to have nothing hidden)
+        self._skip_visibility_fixes = config.get('excel', {}).get('skip_visibility_fixes', False)
+        # "minimum" gives smaller PDFs and a faster export at lower image quality
+        pdf_quality = str(config.get('excel', {}).get('pdf_quality') or 'standard').lower()
+        if pdf_quality not in PDF_QUALITIES:
+            logging.warning(f"Unknown excel.pdf_quality '{pdf_quality}', using 'standard'. Valid values: {', '.join(PDF_QUALITIES)}")
+        self._pdf_quality = PDF_QUALITIES.get(pdf_quality, xlQualityStandard)
+        # Resolve print_options into PrintOptions objects once per converter
+        print_options_config = config.get('print_options', {})
+        self._print_options_by_sheet, self._default_sheet_print_options = self._index_print_options(
+            self._sort_print_options(print_options_config)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _ensure_excel(self):
+        """
+        Returns the Excel.Application owned by this converter, starting it on first use.
+        An instance that crashed or is left in a bad state by the last conversion is replaced.
+        """
+        if self._excel is not None:
+            if _excel_is_reusable(self._excel):
+                return self._excel
+            logging.warning("Excel instance is not reusable, starting a replacement")
+            self._discard_excel()
+
+        if not self._com_acquired:
+            _acquire_com()
+            self._com_acquired = True
+        self._excel, self._excel_pid = _start_excel()
+        return self._excel
+
+    def _discard_excel(self):
+        """
+        Drops the owned Excel instance after a failure. It may not answer Quit(),
+        so its process is killed by PID when the PID is known.
+        """
+        excel = self._excel
+        pid = self._excel_pid
+        self._excel = None
+        self._excel_pid = None
+        if pid:
+            del excel
+            _reap_excel(pid, timeout=0)
+            return
+        try:
+            excel.Quit()
+        except:
+            pass
+
+    def close(self):
+        """
+        Quits the Excel instance owned by this converter and releases its use of COM on this thread.
+        """
+        if self._excel is not None:
+            try:
+                self._excel.Quit()
+            except:
+                pass
+            pid = self._excel_pid
+            self._excel = None
+            self._excel_pid = None
+            _reap_excel(pid)
+
+        self.shutdown()
+
+    def shutdown(self):
+        """
+        Releases this converter's use of COM on the calling thread. COM is only uninitialized
+        when no other converter on the thread still uses it and it was initialized for a
+        converter's own Excel; in pool mode COM is left to whoever owns the thread and the pool.
+        """
+        if not self._com_acquired:
+            return
+        self._com_acquired = False
+        _release_com()
 
     def convert(self, input_path, output_path, pid_queue=None):
         """
         Converts an Excel file to PDF.
+        Only the workbook is opened and closed per call; Excel itself stays running until close().
         """
-        pythoncom.CoInitialize()
-        excel = None
         workbook = None
+        temp_converted = None
+        excel = None
+        restore_mode = None
+        failed = False
         
         try:
-            # Local thge gen_py cache directory
-            gen_path = Path(win32com.__gen_path__)
-            # Remove the problem gen_py cache directory
-            shutil.rmtree(gen_path, ignore_errors=True)
-            # Force new instance for isolation
-            excel = win32com.client.DispatchEx("Excel.Application")
-            excel.Visible = False
-            excel.DisplayAlerts = False
-            
-            # Set default printer to "Microsoft Print to PDF" to avoid printer selection dialogs
-            try:
-                # Get current printer first to understand the format
-                current_printer = excel.ActivePrinter
-                logging.info(f"Current printer: {current_printer}")
-                
-                # Try multiple formats for Microsoft Print to PDF
-                printer_names = [
-                    "Microsoft Print to PDF on Ne00:",
-                    "Microsoft Print to PDF on Ne01:",
-                    "Microsoft Print to PDF on Ne02:", 
-                    "Microsoft Print to PDF on Ne03:",
-                    "Microsoft Print to PDF on Ne04:",
-                    "Microsoft Print to PDF on FILE:",
-                    "Microsoft Print to PDF"
-                ]
-                
-                printer_set = False
-                for printer_name in printer_names:
-                    try:
-                        excel.ActivePrinter = printer_name
-                        logging.info(f"Successfully set printer to: {printer_name}")
-                        printer_set = True
-                        break
-                    except:
-                        continue
-                
-                if not printer_set:
-                    logging.warning("Could not set Microsoft Print to PDF. Using system default printer.")
-                        
-            except Exception as e:
-                logging.warning(f"Could not access printer settings: {e}. Continuing with system default.")
+            if self._excel_pool is not None:
+                _require_com_mta()
+                excel = self._excel_pool.acquire()
+                excel_pid = self._excel_pool.get_pid(excel)
+            else:
+                excel = self._ensure_excel()
+                excel_pid = self._excel_pid
             
             # Send PID back to parent if queue provided
-            if pid_queue:
-                try:
-                    _, pid = win32process.GetWindowThreadProcessId(excel.Hwnd)
-                    pid_queue.put(pid)
-                except Exception as e:
-                    logging.warning(f"Failed to get Excel PID: {e}")
+            if pid_queue and excel_pid:
+                pid_queue.put(excel_pid)
 
             # Handle ReadOnly attribute (remove it if present to allow editing/saving if needed, 
-            # though we primarily need it for 'Edit Mode' as requested)
-            if os.path.exists(input_path):
-                try:
-                    # Ensure file is writable (clear read-only attributes if present)
-                    try:
-                        self._ensure_writable_file(input_path)
-                    except Exception as e:
-                        logging.warning(f"Could not force writable for {input_path}: {e}")
-                except Exception as e:
-                    logging.warning(f"Could not change file permissions for {input_path}: {e}")
+            # though we primarily need it for 'Edit Mode' as requested).
+            # One stat covers both the existence check and the read-only check.
+            try:
+                restore_mode = self._ensure_writable_file(input_path, os.stat(input_path))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logging.warning(f"Could not force writable for {input_path}: {e}")
 
             try:
                 # Open workbook
@@ -207,7 +790,6 @@ class ExcelConverter:
                 raise e
 
             # If the input is an .xlsm (macro-enabled) file, convert it to .xlsx first
-            temp_converted = None
             try:
                 if str(input_path).lower().endswith('.xlsm'):
                     try:
@@ -229,10 +811,11 @@ class ExcelConverter:
             # Optimize Layout and apply print mode
             # Get default print mode from first sheet's config (handles both dict and list formats)
             default_print_options = self._get_sheet_print_options("")  # Empty string to get default config
-            print_mode = default_print_options.get('mode', PRINT_MODE_AUTO)
+            print_mode = default_print_options.mode or PRINT_MODE_AUTO
             logging.info(f"[{workbook.Name}] Using print mode: {print_mode}")
             
-            self._optimize_layout(workbook, print_mode)
+            with _excel_fast_mode(excel):
+                self._optimize_layout(workbook, print_mode)
             
             # Ensure output directory exists
             ensure_dir(output_path)
@@ -251,23 +834,32 @@ class ExcelConverter:
 
         except Exception as e:
             logging.error(f"Error converting {input_path}: {e}")
+            failed = True
             raise e
         finally:
-            # Cleanup
+            # Cleanup - close the workbook only, Excel is reused for the next conversion
             if workbook:
                 try:
                     workbook.Close(SaveChanges=False)
                 except:
                     pass
-            if excel:
+            if self._excel_pool is not None and excel is not None:
+                self._excel_pool.release(excel)
+            elif failed and excel is not None and not _excel_is_reusable(excel):
+                # The failure may have crashed Excel (e.g. RPC_E_SERVERUNAVAILABLE); drop it
+                # so the next convert() starts a fresh instance instead of failing again
+                self._discard_excel()
+
+            # Put back the read-only bit cleared before opening
+            if restore_mode is not None:
                 try:
-                    excel.Quit()
-                except:
-                    pass
+                    os.chmod(input_path, restore_mode)
+                except Exception as e:
+                    logging.warning(f"Could not restore permissions for {input_path}: {e}")
 
             # Remove temporary converted .xlsx if created
             try:
-                if 'temp_converted' in locals() and temp_converted and os.path.exists(temp_converted):
+                if temp_converted and os.path.exists(temp_converted):
                     try:
                         os.remove(temp_converted)
                         logging.info(f"Removed temporary converted file: {temp_converted}")
@@ -276,8 +868,6 @@ class ExcelConverter:
             except Exception:
                 pass
 
-            pythoncom.CoUninitialize()
-
 
 
     def _fix_shape_placement(self, sheet):
@@ -287,7 +877,8 @@ class ExcelConverter:
         """
         try:
             # xlMove = 2 (Move but don't size with cells)
-            # This keeps original object dimensions while following cell layout
+            # This keeps original object dimensions while following cell layout.
+            # ShapeRange has no Placement property, so this has to be set per shape.
             for shape in sheet.Shapes:
                 try:
                     shape.Placement = 2
@@ -296,22 +887,25 @@ class ExcelConverter:
         except Exception as e:
             logging.warning(f"Could not fix shape placement in {sheet.Name}: {e}")
 
-    def _fit_shapes_to_cells(self, sheet, workbook_name):
-        """
-        DISABLED: Preserves original shape positions and sizes.
-        Does not modify shapes to preserve exact Excel layout.
-        """
-        logging.info(f"[{workbook_name}] {sheet.Name}: Preserving original shape layout")
-
-    def _ensure_writable_file(self, path):
+    def _ensure_writable_file(self, path, st=None):
         """
         Ensure the input file is writable by clearing read-only attributes and setting write permissions.
         On Windows, clears the FILE_ATTRIBUTE_READONLY bit when present.
+        Only the owner write bit is added, and nothing is touched when the file is already writable.
+
+        Returns:
+            The original st_mode when it was changed (so the caller can restore it), else None
         """
         try:
+            st = st or os.stat(path)
+            if st.st_mode & stat.S_IWRITE:
+                return None
+
             # Make sure OS-level write permission bit is set
+            restore_mode = None
             try:
-                os.chmod(path, os.stat(path).st_mode | stat.S_IWRITE)
+                os.chmod(path, st.st_mode | stat.S_IWRITE)
+                restore_mode = st.st_mode
             except Exception:
                 pass
 
@@ -327,10 +921,10 @@ class ExcelConverter:
                 pass
 
             logging.info(f"Ensured writable: {path}")
-            return True
+            return restore_mode
         except Exception as e:
             logging.warning(f"Could not ensure writable for {path}: {e}")
-            return False
+            return None
 
     def _ensure_shapes_visible(self, sheet, workbook_name):
         """
@@ -340,16 +934,24 @@ class ExcelConverter:
         Provides detailed analysis of multi-image rows.
         """
         try:
+            shapes = sheet.Shapes
+            if shapes.Count == 0:
+                return
+            
             shape_count = 0
             fixed_count = 0
             problem_shapes = 0
             row_image_analysis = {}
             
-            for shape in sheet.Shapes:
+            # Kept per shape on purpose: the multi-image row report needs each shape's
+            # name, type and anchor cell, and Visible/PrintObject are only written for
+            # the shapes that need it (reads are a few COM calls per shape)
+            for shape in shapes:
                 try:
                     shape_count += 1
                     shape_name = getattr(shape, 'Name', f'Shape{shape_count}')
                     shape_type = getattr(shape, 'Type', 'Unknown')
+                    visible = shape.Visible
                     
                     # Determine which row this shape is in for multi-image analysis
                     try:
@@ -363,30 +965,25 @@ class ExcelConverter:
                             'name': shape_name,
                             'type': shape_type,
                             'column': col_num,
-                            'visible': getattr(shape, 'Visible', True)
+                            'visible': visible
                         })
                     except:
                         pass
                     
                     # Ensure shape is visible
-                    if hasattr(shape, 'Visible'):
-                        if not shape.Visible:
-                            shape.Visible = True
-                            fixed_count += 1
-                            logging.debug(f"[{workbook_name}] {sheet.Name}: Made shape '{shape_name}' visible")
+                    if not visible:
+                        shape.Visible = True
+                        fixed_count += 1
+                        logging.debug(f"[{workbook_name}] {sheet.Name}: Made shape '{shape_name}' visible")
                     
-                    # Ensure shape prints
+                    # Ensure shape prints (only write when it is switched off)
                     try:
-                        shape.PrintObject = True
+                        if not shape.PrintObject:
+                            shape.PrintObject = True
                     except:
                         pass
                     
-                    # Set stable placement to prevent issues during export
-                    try:
-                        # xlMove = 2 (Move but don't size with cells)
-                        shape.Placement = 2
-                    except:
-                        pass
+                    # Placement is already set to xlMove by _fix_shape_placement
                     
                     # Check for potentially problematic embedded objects
                     try:
@@ -424,38 +1021,6 @@ class ExcelConverter:
         except Exception as e:
             logging.warning(f"Could not ensure shapes visible in {sheet.Name}: {e}")
 
-    def _fix_tables_for_print(self, sheet, workbook_name):
-        """
-        Ensures Excel Tables (ListObjects) are properly formatted for printing.
-        Preserves fonts, styles, and ensures all content is visible.
-        """
-        try:
-            table_count = sheet.ListObjects.Count
-            if table_count == 0:
-                return
-            
-            for i in range(1, table_count + 1):
-                try:
-                    table = sheet.ListObjects(i)
-                    table_range = table.Range
-                    
-                    # DISABLED: Do not autofit table rows - preserve original heights
-                    
-                    # Ensure table style allows printing
-                    try:
-                        # Make sure borders are visible for print
-                        table_range.Borders.LineStyle = 1  # xlContinuous
-                    except:
-                        pass
-                    
-                    logging.info(f"[{workbook_name}] {sheet.Name}: Prepared table '{table.Name}' for print")
-                    
-                except Exception as e:
-                    logging.warning(f"Could not fix table {i} in {sheet.Name}: {e}")
-                    
-        except Exception as e:
-            logging.warning(f"Could not fix tables in {sheet.Name}: {e}")
-
     def _adjust_usedrange_for_images(self, sheet, workbook_name):
         """
         Intelligently calculate print area based on rows with actual content (text or objects).
@@ -631,7 +1196,7 @@ class ExcelConverter:
             try:
                 rng = sheet.Range(sheet.Cells(start_row, start_col), sheet.Cells(actual_last_row, new_last_col))
                 addr = rng.Address
-                sheet.PageSetup.PrintArea = addr
+                _apply_pagesetup(sheet.PageSetup, PrintArea=addr)
                 
                 rows_removed = last_row - actual_last_row
                 if rows_removed > 0:
@@ -644,84 +1209,69 @@ class ExcelConverter:
         except Exception as e:
             logging.warning(f"[{workbook_name}] {sheet.Name}: Error adjusting UsedRange for images: {e}")
 
-    def _ensure_text_visible(self, sheet, workbook_name):
-        """
-        DISABLED: Preserves original Excel text formatting and cell dimensions.
-        Does not modify cell properties to preserve exact Excel layout.
-        """
-        logging.info(f"[{workbook_name}] {sheet.Name}: Preserving original text layout")
-
-    def _fix_cell_layout(self, sheet, workbook_name):
+    def _sort_print_options(self, print_options_config):
         """
-        DISABLED: Preserves original cell alignment and layout.
-        Does not modify cell properties to preserve exact Excel layout.
+        Pre-sort list-format print_options by priority once, with sheet names as frozensets.
+        Returns a list of (sheets, PrintOptions) tuples where sheets is None for default configs
+        (matches all sheets). A single dict config becomes one entry that matches all sheets.
         """
-        logging.info(f"[{workbook_name}] {sheet.Name}: Preserving original cell layout")
+        # Backward compatibility: single dict format applies to every sheet
+        if isinstance(print_options_config, dict):
+            return [(None, PrintOptions(print_options_config))]
+        if not isinstance(print_options_config, list):
+            return []
+        
+        entries = []
+        for config in print_options_config:
+            options = PrintOptions(config)
+            sheets = options.sheets
+            
+            # If sheets is None or empty, it's a default config (matches all)
+            if sheets is None or sheets == []:
+                entries.append((options.priority, None, options))
+            # Only a list of sheet names can match by name
+            elif isinstance(sheets, list):
+                entries.append((options.priority, frozenset(sheets), options))
+        
+        # Sort by priority (lower number = higher priority); stable, so config order breaks ties
+        entries.sort(key=lambda x: x[0])
+        return [(sheets, options) for _, sheets, options in entries]
 
-    def _autofit_columns_smart(self, sheet, workbook_name):
+    def _index_print_options(self, sorted_print_options):
         """
-        DISABLED: Preserves original column widths.
-        Does not modify column dimensions to preserve exact Excel layout.
+        Resolve the priority-ordered print_options into a sheet-name index once.
+        Returns (by_sheet, default): by_sheet maps each listed sheet name to the first entry
+        naming it, and default is the first entry without sheets (or the built-in defaults).
+        Named entries ranked below the first default entry can never match, so they are skipped.
         """
-        logging.info(f"[{workbook_name}] {sheet.Name}: Preserving original column widths")
+        by_sheet = {}
+        for sheets, options in sorted_print_options:
+            if sheets is None:
+                return by_sheet, options
+            for sheet_name in sheets:
+                by_sheet.setdefault(sheet_name, options)
+        return by_sheet, _DEFAULT_PRINT_OPTIONS
 
     def _get_sheet_print_options(self, sheet_name):
         """
         Get the appropriate print_options for a specific sheet based on sheet name matching.
         Supports both single print_options dict and list of print_options with priority.
-        Returns the matched print_options dict.
+        Returns the matched PrintOptions from the index built at init.
         """
-        print_options_config = self.config.get('print_options', {})
-        
-        # Handle backward compatibility: single dict format
-        if isinstance(print_options_config, dict):
-            return print_options_config
-        
-        # Handle list format: multiple print_options with sheet matching
-        if isinstance(print_options_config, list):
-            matched_configs = []
-            
-            for config in print_options_config:
-                sheets = config.get('sheets', None)
-                priority = config.get('priority', 999)
-                
-                # If sheets is None or empty, it's a default config (matches all)
-                if sheets is None or sheets == []:
-                    matched_configs.append((priority, config))
-                # If sheet name matches any in the list
-                elif isinstance(sheets, list) and sheet_name in sheets:
-                    matched_configs.append((priority, config))
-            
-            # Sort by priority (lower number = higher priority)
-            if matched_configs:
-                matched_configs.sort(key=lambda x: x[0])
-                return matched_configs[0][1]  # Return highest priority config
-        
-        # Fallback: return default config
-        return {
-            'mode': 'auto',
-            'page_size': 'auto',
-            'orientation': 'auto',
-            'scaling': 'fit_columns',
-            'scaling_percent': 100,
-            'margins': 'normal',
-            'print_header_footer': True,
-            'print_row_col_headings': False
-        }
-
-    def _determine_orientation(self, sheet, orientation_setting):
+        return self._print_options_by_sheet.get(sheet_name, self._default_sheet_print_options)
+
+    def _determine_orientation(self, sheet, orientation_setting, content_size=None):
         """
         Determine the appropriate page orientation based on content and config.
         
         Args:
             sheet: Excel sheet object
-            orientation_setting: Config value ('auto', 'portrait', or 'landscape')
+            orientation_setting: Lower-cased config value ('auto', 'portrait', or 'landscape')
+            content_size: Optional (width, height) already read from UsedRange
         
         Returns:
             xlPortrait (1) or xlLandscape (2)
         """
-        orientation_setting = str(orientation_setting).lower() if orientation_setting else 'auto'
-        
         # Forced orientations
         if orientation_setting == 'portrait':
             return xlPortrait
@@ -730,8 +1280,7 @@ class ExcelConverter:
         
         # Auto-detect based on content dimensions
         try:
-            total_width_pts = sheet.UsedRange.Width
-            total_height_pts = sheet.UsedRange.Height
+            total_width_pts, total_height_pts = content_size or _used_range_size(sheet)
             
             if total_width_pts > total_height_pts:
                 return xlLandscape  # Wide content -> Landscape
@@ -745,143 +1294,153 @@ class ExcelConverter:
         Prepares workbook for print - merged logic from optimize_layout and enhance_layout.
         Ensures no content is hidden: expands collapsed groups, fixes row heights, fixes images.
         """
+        # workbook.Name and sheet.Name are COM property reads; bind them once
+        # instead of re-reading them for every helper call and log line
+        workbook_name = workbook.Name
 
         # For native_print mode, set basic PageSetup to preserve exact Excel dimensions
         if print_mode == PRINT_MODE_NATIVE_PRINT:
-            logging.info(f"[{workbook.Name}] Native print mode - preserving exact Excel dimensions for RAG")
-            for sheet in workbook.Sheets:
-                try:
-                    # Set to no scaling - preserve exact dimensions (100% zoom)
-                    sheet.PageSetup.Zoom = 100
-                    sheet.PageSetup.FitToPagesWide = False
-                    sheet.PageSetup.FitToPagesTall = False
-                    
-                    # Set print area to used range only (removes white space)
+            logging.info(f"[{workbook_name}] Native print mode - preserving exact Excel dimensions for RAG")
+            with _print_communication_deferred(workbook.Application):
+                for sheet in workbook.Sheets:
                     try:
-                        # Prefer enhanced computation that includes image columns when present
-                        self._adjust_usedrange_for_images(sheet, workbook.Name)
-                    except Exception:
+                        ps = sheet.PageSetup
+                        # Set to no scaling - preserve exact dimensions (100% zoom)
+                        _apply_pagesetup(ps, Zoom=100, FitToPagesWide=False, FitToPagesTall=False)
+                    
+                        # Set print area to used range only (removes white space)
                         try:
-                            sheet.PageSetup.PrintArea = sheet.UsedRange.Address
-                        except:
-                            pass
+                            # Prefer enhanced computation that includes image columns when present
+                            self._adjust_usedrange_for_images(sheet, workbook_name)
+                        except Exception:
+                            try:
+                                _apply_pagesetup(ps, PrintArea=sheet.UsedRange.Address)
+                            except:
+                                pass
                     
-                    logging.info(f"[{workbook.Name}] {sheet.Name}: Native print - exact dimensions preserved (no scaling)")
-                except Exception as e:
-                    logging.warning(f"Could not set native print mode for {sheet.Name}: {e}")
+                        logging.info(f"[{workbook_name}] {sheet.Name}: Native print - exact dimensions preserved (no scaling)")
+                    except Exception as e:
+                        logging.warning(f"Could not set native print mode for {sheet.Name}: {e}")
             return
 
-        for sheet in workbook.Sheets:
+        # Materialize the Sheets collection once; uniform_page_size walks it twice more
+        sheets = list(workbook.Sheets)
+        for sheet in sheets:
+            sheet_name = sheet.Name
             try:
-                logging.info(f"[{workbook.Name}] Processing Sheet: {sheet.Name}")
+                logging.info(f"[{workbook_name}] Processing Sheet: {sheet_name}")
                 
                 # Get sheet-specific print_options (supports multiple configs with sheet matching)
-                print_options = self._get_sheet_print_options(sheet.Name)
-                sheet_print_mode = print_options.get('mode', print_mode)
-                page_size = print_options.get('page_size', 'A4').upper()
-                rows_per_page = print_options.get('rows_per_page')
-                orientation = print_options.get('orientation', 'auto')
+                print_options = self._get_sheet_print_options(sheet_name)
+                sheet_print_mode = print_options.mode or print_mode
+                page_size = print_options.page_size
+                rows_per_page = print_options.rows_per_page
+                orientation = print_options.orientation
                 
-                logging.info(f"[{workbook.Name}] {sheet.Name}: Using print mode '{sheet_print_mode}' (priority-based config)")
+                logging.info(f"[{workbook_name}] {sheet_name}: Using print mode '{sheet_print_mode}' (priority-based config)")
                 
                 # ========================================
-                # STEP 1: EXPAND ALL HIDDEN CONTENT (ALWAYS)
+                # STEP 1: EXPAND ALL HIDDEN CONTENT (unless excel.skip_visibility_fixes)
                 # Critical for ExportAsFixedFormat - must show all content
                 # ========================================
-                self._expand_all_groups(sheet, workbook.Name)
-                self._unhide_rows_columns(sheet, workbook.Name)
+                if not self._skip_visibility_fixes:
+                    self._expand_all_groups(sheet, workbook_name)
+                    self._unhide_rows_columns(sheet, workbook_name)
                 
                 # ========================================
                 # STEP 2: FIX SHAPE/IMAGE PLACEMENT (ALWAYS)
                 # Prevent images from being hidden or distorted
                 # ========================================
                 self._fix_shape_placement(sheet)
-                self._ensure_shapes_visible(sheet, workbook.Name)
+                self._ensure_shapes_visible(sheet, workbook_name)
+
+                # Steps 3 and 6.5 (and uniform_page_size afterwards) add page breaks
+                _hide_page_breaks(sheet)
 
                 # ========================================
                 # STEP 3: PRINT MODE SPECIFIC SETUP
                 # ========================================
                 if sheet_print_mode == PRINT_MODE_ONE_PAGE:
-                    self._apply_one_page_mode(sheet, workbook.Name, orientation, page_size)
+                    self._apply_one_page_mode(sheet, workbook_name, orientation, page_size)
                 elif sheet_print_mode == PRINT_MODE_TABLE_ROW_BREAK:
-                    page_ranges = self._apply_table_row_break_mode(sheet, workbook.Name, rows_per_page, orientation, page_size)
+                    page_ranges = self._apply_table_row_break_mode(sheet, workbook_name, rows_per_page, orientation, page_size)
                 elif sheet_print_mode == PRINT_MODE_AUTO_PAGE_SIZE:
-                    self._apply_auto_page_size_mode(sheet, workbook.Name, page_size, orientation)
+                    self._apply_auto_page_size_mode(sheet, workbook_name, page_size, orientation)
                 elif sheet_print_mode == PRINT_MODE_UNIFORM_PAGE_SIZE:
                     # Uniform page size is handled at workbook level, not per-sheet
                     # Skip here - will be applied after all sheets are processed
                     pass
                 else:
                     # Default AUTO mode
-                    self._apply_auto_mode(sheet, workbook.Name, orientation, page_size)
+                    self._apply_auto_mode(sheet, workbook_name, orientation, page_size)
 
                 # ========================================
                 # STEP 4: PRESERVE ORIGINAL DIMENSIONS (NO MODIFICATIONS)
                 # Keep original row heights and column widths from Excel file
                 # ========================================
-                logging.info(f"[{workbook.Name}] {sheet.Name}: Preserving original row/column dimensions")
+                logging.info(f"[{workbook_name}] {sheet_name}: Preserving original row/column dimensions")
 
                 # ========================================
                 # STEP 5: APPLY SCALING (ALWAYS APPLIED)
                 # Match Excel's print scaling options from config
                 # This controls how Excel fits content to pages during PDF export
                 # ========================================
-                scaling = print_options.get('scaling', 'fit_columns')
-                scaling_percent = print_options.get('scaling_percent', 100)
-                self._apply_scaling(sheet, workbook.Name, scaling, scaling_percent)
+                scaling = print_options.scaling
+                scaling_percent = print_options.scaling_percent
+                self._apply_scaling(sheet, workbook_name, scaling, scaling_percent)
 
                 # ========================================
                 # STEP 6: APPLY MARGINS
                 # Match Excel's print margin options
                 # ========================================
-                margins = print_options.get('margins', 'normal')
-                custom_margins = print_options.get('custom_margins', {})
-                self._apply_margins(sheet, workbook.Name, margins, custom_margins)
+                margins = print_options.margins
+                custom_margins = print_options.custom_margins
+                self._apply_margins(sheet, workbook_name, margins, custom_margins)
 
                 # ========================================
                 # STEP 6.5: APPLY CUSTOM PAGE BREAKS
                 # Insert page breaks based on row/column limits
                 # ========================================
-                rows_per_page_custom = print_options.get('rows_per_page')
-                columns_per_page_custom = print_options.get('columns_per_page')
+                rows_per_page_custom = print_options.rows_per_page
+                columns_per_page_custom = print_options.columns_per_page
                 page_ranges = None
                 
                 # Always calculate page ranges if row headings are enabled or rows_per_page is set
-                print_headings = print_options.get('print_row_col_headings', False)
+                print_headings = print_options.print_row_col_headings
                 
                 if rows_per_page_custom:
-                    page_ranges = self._insert_page_breaks_by_rows(sheet, workbook.Name, rows_per_page_custom)
+                    page_ranges = self._insert_page_breaks_by_rows(sheet, workbook_name, rows_per_page_custom)
                 elif print_headings:
                     # Auto-calculate page breaks based on print area for row headings to work properly
-                    page_ranges = self._auto_calculate_page_breaks_for_headings(sheet, workbook.Name)
+                    page_ranges = self._auto_calculate_page_breaks_for_headings(sheet, workbook_name)
                 
                 if columns_per_page_custom:
-                    self._insert_page_breaks_by_columns(sheet, workbook.Name, columns_per_page_custom)
+                    self._insert_page_breaks_by_columns(sheet, workbook_name, columns_per_page_custom)
 
                 # ========================================
                 # STEP 7: SETUP HEADER AND FOOTER
                 # Add sheet name to header and row range to header (moved from footer for PDF trimming)
                 # ========================================
-                if print_options.get('print_header_footer', True):
+                if print_options.print_header_footer:
                     # Pass print_options and page_ranges to header setup for accurate row tracking
-                    self._setup_header_footer(sheet, workbook.Name, print_options, page_ranges)
+                    self._setup_header_footer(sheet, workbook_name, print_options, page_ranges)
                 else:
                     # Clear any existing header/footer
-                    self._clear_header_footer(sheet, workbook.Name)
+                    self._clear_header_footer(sheet, workbook_name)
 
                 # ========================================
                 # STEP 8: ROW AND COLUMN HEADINGS
                 # Print Excel row numbers (1,2,3...) and column letters (A,B,C...)
                 # ========================================
-                print_headings = print_options.get('print_row_col_headings', False)
-                self._set_row_col_headings(sheet, workbook.Name, print_headings)
+                print_headings = print_options.print_row_col_headings
+                self._set_row_col_headings(sheet, workbook_name, print_headings)
 
             except Exception as e:
-                logging.warning(f"Could not prepare sheet {sheet.Name}: {e}")
+                logging.warning(f"Could not prepare sheet {sheet_name}: {e}")
 
         # Handle uniform_page_size mode at workbook level (after all sheets processed)
         if print_mode == PRINT_MODE_UNIFORM_PAGE_SIZE:
-            self._apply_uniform_page_size_mode(workbook, page_size)
+            self._apply_uniform_page_size_mode(workbook, page_size, sheets)
 
     def _expand_all_groups(self, sheet, workbook_name):
         """
@@ -905,29 +1464,12 @@ class ExcelConverter:
         Unhides all hidden rows and columns to ensure all data is visible.
         """
         try:
-            hidden_rows = 0
-            hidden_cols = 0
-            
-            # Unhide all rows in used range
-            for row in sheet.UsedRange.Rows:
-                try:
-                    if row.Hidden:
-                        row.Hidden = False
-                        hidden_rows += 1
-                except:
-                    pass
-            
-            # Unhide all columns in used range
-            for col in sheet.UsedRange.Columns:
-                try:
-                    if col.Hidden:
-                        col.Hidden = False
-                        hidden_cols += 1
-                except:
-                    pass
+            used_range = sheet.UsedRange
             
-            if hidden_rows > 0 or hidden_cols > 0:
-                logging.info(f"[{workbook_name}] {sheet.Name}: Unhid {hidden_rows} rows, {hidden_cols} columns")
+            # One write per axis unhides every row and column in the used range.
+            # Hidden on a partly hidden range reads False, so it cannot be used to skip the write.
+            used_range.EntireRow.Hidden = False
+            used_range.EntireColumn.Hidden = False
         except Exception as e:
             logging.warning(f"Could not unhide rows/columns in {sheet.Name}: {e}")
 
@@ -937,50 +1479,38 @@ class ExcelConverter:
         Options: no_scaling, fit_sheet, fit_columns, fit_rows, custom
         """
         try:
-            scaling = scaling.lower() if scaling else 'fit_columns'
-            
-            if scaling == 'no_scaling':
-                # Print at actual size (100% zoom, no fitting)
-                sheet.PageSetup.Zoom = 100
-                sheet.PageSetup.FitToPagesWide = False
-                sheet.PageSetup.FitToPagesTall = False
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> No Scaling (actual size)")
+            ps = sheet.PageSetup
+            with _print_communication_deferred(sheet.Application):
+                if scaling == 'no_scaling':
+                    # Print at actual size (100% zoom, no fitting)
+                    _apply_pagesetup(ps, Zoom=100, FitToPagesWide=False, FitToPagesTall=False)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> No Scaling (actual size)")
                 
-            elif scaling == 'fit_sheet':
-                # Fit entire sheet on one page
-                sheet.PageSetup.Zoom = False
-                sheet.PageSetup.FitToPagesWide = 1
-                sheet.PageSetup.FitToPagesTall = 1
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit Sheet on One Page")
+                elif scaling == 'fit_sheet':
+                    # Fit entire sheet on one page
+                    _apply_pagesetup(ps, Zoom=False, FitToPagesWide=1, FitToPagesTall=1)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit Sheet on One Page")
                 
-            elif scaling == 'fit_columns':
-                # Fit all columns on one page (rows can span multiple pages)
-                sheet.PageSetup.Zoom = False
-                sheet.PageSetup.FitToPagesWide = 1
-                sheet.PageSetup.FitToPagesTall = False
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Columns on One Page")
+                elif scaling == 'fit_columns':
+                    # Fit all columns on one page (rows can span multiple pages)
+                    _apply_pagesetup(ps, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Columns on One Page")
                 
-            elif scaling == 'fit_rows':
-                # Fit all rows on one page (columns can span multiple pages)
-                sheet.PageSetup.Zoom = False
-                sheet.PageSetup.FitToPagesWide = False
-                sheet.PageSetup.FitToPagesTall = 1
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Rows on One Page")
+                elif scaling == 'fit_rows':
+                    # Fit all rows on one page (columns can span multiple pages)
+                    _apply_pagesetup(ps, Zoom=False, FitToPagesWide=False, FitToPagesTall=1)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Rows on One Page")
                 
-            elif scaling == 'custom':
-                # Custom scaling percentage (1-400%)
-                zoom = max(1, min(400, scaling_percent))
-                sheet.PageSetup.Zoom = zoom
-                sheet.PageSetup.FitToPagesWide = False
-                sheet.PageSetup.FitToPagesTall = False
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Custom {zoom}%")
+                elif scaling == 'custom':
+                    # Custom scaling percentage (1-400%)
+                    zoom = max(1, min(400, scaling_percent))
+                    _apply_pagesetup(ps, Zoom=zoom, FitToPagesWide=False, FitToPagesTall=False)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Custom {zoom}%")
                 
-            else:
-                # Default: fit columns
-                sheet.PageSetup.Zoom = False
-                sheet.PageSetup.FitToPagesWide = 1
-                sheet.PageSetup.FitToPagesTall = False
-                logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Columns (default)")
+                else:
+                    # Default: fit columns
+                    _apply_pagesetup(ps, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Scaling -> Fit All Columns (default)")
                 
         except Exception as e:
             logging.warning(f"Could not apply scaling to {sheet.Name}: {e}")
@@ -991,93 +1521,80 @@ class ExcelConverter:
         Options: normal, wide, narrow, custom
         Margin values are in centimeters, converted to points (1 cm = 28.35 points)
         """
-        CM_TO_POINTS = 28.35
-        
-        # Predefined margin presets (matching Excel exactly)
-        MARGIN_PRESETS = {
-            'normal': {'top': 1.91, 'bottom': 1.91, 'left': 1.78, 'right': 1.78, 'header': 0.76, 'footer': 0.76},
-            'wide': {'top': 2.54, 'bottom': 2.54, 'left': 2.54, 'right': 2.54, 'header': 1.27, 'footer': 1.27},
-            'narrow': {'top': 1.91, 'bottom': 1.91, 'left': 0.64, 'right': 0.64, 'header': 0.76, 'footer': 0.76}
-        }
-        
         try:
-            margins = margins.lower() if margins else 'normal'
-            
             if margins == 'custom' and custom_margins:
-                # Use custom margin values
-                m = custom_margins
-            elif margins in MARGIN_PRESETS:
-                m = MARGIN_PRESETS[margins]
+                # Use custom margin values (convert cm to points)
+                margin_points = _margins_to_points(custom_margins)
             else:
-                m = MARGIN_PRESETS['normal']
+                # Presets are converted to points at import time
+                margin_points = _MARGIN_PRESETS_POINTS.get(margins, _MARGIN_PRESETS_POINTS['normal'])
             
-            # Apply margins (convert cm to points)
-            sheet.PageSetup.TopMargin = m.get('top', 1.91) * CM_TO_POINTS
-            sheet.PageSetup.BottomMargin = m.get('bottom', 1.91) * CM_TO_POINTS
-            sheet.PageSetup.LeftMargin = m.get('left', 1.78) * CM_TO_POINTS
-            sheet.PageSetup.RightMargin = m.get('right', 1.78) * CM_TO_POINTS
-            sheet.PageSetup.HeaderMargin = m.get('header', 0.76) * CM_TO_POINTS
-            sheet.PageSetup.FooterMargin = m.get('footer', 0.76) * CM_TO_POINTS
+            # Apply margins
+            ps = sheet.PageSetup
+            with _print_communication_deferred(sheet.Application):
+                for name, value in margin_points.items():
+                    setattr(ps, name, value)
             
             logging.info(f"[{workbook_name}] {sheet.Name}: Margins -> {margins.capitalize()}")
             
         except Exception as e:
             logging.warning(f"Could not apply margins to {sheet.Name}: {e}")
 
-    def _apply_auto_mode(self, sheet, workbook_name, orientation='auto', page_size='auto'):
+    def _apply_auto_mode(self, sheet, workbook_name, orientation='auto', page_size='AUTO'):
         """
         Default AUTO mode - fit columns to page, configurable orientation and page size.
         NOTE: This mode applies fitting which may alter dimensions.
         For exact dimension preservation, use native_print mode instead.
         """
         try:
-            total_width_pts = sheet.UsedRange.Width
-            total_height_pts = sheet.UsedRange.Height
+            total_width_pts, total_height_pts = _used_range_size(sheet)
+            content_size = (total_width_pts, total_height_pts)
         except:
             total_width_pts = 0
             total_height_pts = 0
+            content_size = None
 
-        # Determine orientation
-        page_orientation = self._determine_orientation(sheet, orientation)
-        sheet.PageSetup.Orientation = page_orientation
+        ps = sheet.PageSetup
+
+        # Determine orientation (written together with the fit settings below)
+        page_orientation = self._determine_orientation(sheet, orientation, content_size)
         
         # Set paper size based on config or auto-detect
-        page_size_upper = page_size.upper() if page_size else "AUTO"
+        page_size_upper = page_size
         
         if page_size_upper == "AUTO":
             # Auto-detect paper size based on content and orientation
             if page_orientation == xlLandscape:
                 # Landscape orientation
                 if total_width_pts < 900:
-                    sheet.PageSetup.PaperSize = xlPaperA4
+                    ps.PaperSize = xlPaperA4
                     logging.info(f"[{workbook_name}] {sheet.Name}: Auto-Layout -> A4 Landscape")
                 else:
-                    sheet.PageSetup.PaperSize = xlPaperA3
+                    ps.PaperSize = xlPaperA3
                     logging.info(f"[{workbook_name}] {sheet.Name}: Auto-Layout -> A3 Landscape")
             else:
                 # Portrait orientation
-                sheet.PageSetup.PaperSize = xlPaperA4
+                ps.PaperSize = xlPaperA4
                 logging.info(f"[{workbook_name}] {sheet.Name}: Auto-Layout -> A4 Portrait")
         else:
             # Use configured page size
             if page_size_upper in PAGE_SIZES:
                 page_info = PAGE_SIZES[page_size_upper]
                 try:
-                    sheet.PageSetup.PaperSize = page_info["xl_const"]
+                    ps.PaperSize = page_info.xl_const
                     logging.info(f"[{workbook_name}] {sheet.Name}: Auto-Layout -> {page_size_upper} {('Landscape' if page_orientation == xlLandscape else 'Portrait')}")
                 except Exception as e:
                     # Fallback to A3
-                    sheet.PageSetup.PaperSize = xlPaperA3
+                    ps.PaperSize = xlPaperA3
                     logging.warning(f"[{workbook_name}] {sheet.Name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use C_SHEET, D_SHEET, or E_SHEET instead.")
             else:
                 # Fallback to A4 if invalid page size
-                sheet.PageSetup.PaperSize = xlPaperA4
+                ps.PaperSize = xlPaperA4
                 logging.warning(f"[{workbook_name}] {sheet.Name}: Invalid page size '{page_size}', using A4")
 
         # Force Fit to 1 Page Wide (keeps original column proportions)
-        sheet.PageSetup.Zoom = False
-        sheet.PageSetup.FitToPagesWide = 1
-        sheet.PageSetup.FitToPagesTall = False 
+        with _print_communication_deferred(sheet.Application):
+            _apply_pagesetup(ps, Orientation=page_orientation, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
         
         # Set print area to used range only (removes white space)
         try:
@@ -1085,36 +1602,34 @@ class ExcelConverter:
             self._adjust_usedrange_for_images(sheet, workbook_name)
         except Exception:
             try:
-                sheet.PageSetup.PrintArea = sheet.UsedRange.Address
+                _apply_pagesetup(ps, PrintArea=sheet.UsedRange.Address)
             except:
                 pass
 
-    def _apply_one_page_mode(self, sheet, workbook_name, orientation='auto', page_size='auto'):
+    def _apply_one_page_mode(self, sheet, workbook_name, orientation='auto', page_size='AUTO'):
         """
         ONE PAGE mode - fit entire sheet content to a single page.
         """
         logging.info(f"[{workbook_name}] {sheet.Name}: Applying One Page mode")
+        ps = sheet.PageSetup
         
         # Set page size
-        page_size_upper = page_size.upper() if page_size else "AUTO"
+        page_size_upper = page_size
         if page_size_upper != "AUTO" and page_size_upper in PAGE_SIZES:
             try:
-                sheet.PageSetup.PaperSize = PAGE_SIZES[page_size_upper]["xl_const"]
+                ps.PaperSize = PAGE_SIZES[page_size_upper].xl_const
             except Exception as e:
                 # Fallback to A3
-                sheet.PageSetup.PaperSize = xlPaperA3
+                ps.PaperSize = xlPaperA3
                 logging.warning(f"[{workbook_name}] {sheet.Name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use ARCH_C, ARCH_D, or ARCH_E.")
         else:
-            sheet.PageSetup.PaperSize = xlPaperA4
+            ps.PaperSize = xlPaperA4
         
         # Determine and set orientation
         page_orientation = self._determine_orientation(sheet, orientation)
-        sheet.PageSetup.Orientation = page_orientation
-        
-        # Fit BOTH width and height to 1 page
-        sheet.PageSetup.Zoom = False
-        sheet.PageSetup.FitToPagesWide = 1
-        sheet.PageSetup.FitToPagesTall = 1
+        with _print_communication_deferred(sheet.Application):
+            # Fit BOTH width and height to 1 page
+            _apply_pagesetup(ps, Orientation=page_orientation, Zoom=False, FitToPagesWide=1, FitToPagesTall=1)
         
         # Set print area to used range only (removes white space)
         try:
@@ -1122,34 +1637,33 @@ class ExcelConverter:
             self._adjust_usedrange_for_images(sheet, workbook_name)
         except Exception:
             try:
-                sheet.PageSetup.PrintArea = sheet.UsedRange.Address
+                _apply_pagesetup(ps, PrintArea=sheet.UsedRange.Address)
             except:
                 pass
 
-    def _apply_table_row_break_mode(self, sheet, workbook_name, rows_per_page=None, orientation='auto', page_size='auto'):
+    def _apply_table_row_break_mode(self, sheet, workbook_name, rows_per_page=None, orientation='auto', page_size='AUTO'):
         """
         TABLE ROW BREAK mode - insert page breaks after tables or every N rows.
         """
         logging.info(f"[{workbook_name}] {sheet.Name}: Applying Table Row Break mode")
+        ps = sheet.PageSetup
         
         # Set paper size
-        page_size_upper = page_size.upper() if page_size else "AUTO"
+        page_size_upper = page_size
         if page_size_upper != "AUTO" and page_size_upper in PAGE_SIZES:
             try:
-                sheet.PageSetup.PaperSize = PAGE_SIZES[page_size_upper]["xl_const"]
+                ps.PaperSize = PAGE_SIZES[page_size_upper].xl_const
             except Exception as e:
                 # Fallback to A3
-                sheet.PageSetup.PaperSize = xlPaperA3
+                ps.PaperSize = xlPaperA3
                 logging.warning(f"[{workbook_name}] {sheet.Name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use ARCH_C, ARCH_D, or ARCH_E.")
         else:
-            sheet.PageSetup.PaperSize = xlPaperA4
+            ps.PaperSize = xlPaperA4
         
         # Set orientation
         page_orientation = self._determine_orientation(sheet, orientation)
-        sheet.PageSetup.Orientation = page_orientation
-        sheet.PageSetup.Zoom = False
-        sheet.PageSetup.FitToPagesWide = 1
-        sheet.PageSetup.FitToPagesTall = False
+        with _print_communication_deferred(sheet.Application):
+            _apply_pagesetup(ps, Orientation=page_orientation, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
         
         # Clear existing page breaks
         try:
@@ -1207,31 +1721,31 @@ class ExcelConverter:
             
             # Get current page setup to calculate printable height
             try:
-                page_size_const = sheet.PageSetup.PaperSize
-                orientation = sheet.PageSetup.Orientation
+                ps = sheet.PageSetup
+                page_size_const = ps.PaperSize
+                orientation = ps.Orientation
                 
                 # Find matching page size info
                 printable_height = None
-                for size_name, size_info in PAGE_SIZES.items():
-                    if size_info["xl_const"] == page_size_const:
-                        if orientation == xlLandscape:
-                            # For landscape, swap width and height
-                            printable_height = size_info["width"] - 100  # Account for margins
-                        else:
-                            printable_height = size_info["printable_height"]
-                        break
+                size_info = _PAGE_SIZES_BY_CONST.get(page_size_const)
+                if size_info is not None:
+                    if orientation == xlLandscape:
+                        # For landscape, swap width and height
+                        printable_height = size_info.width - 100  # Account for margins
+                    else:
+                        printable_height = size_info.printable_height
                 
                 # Fallback: use A4 portrait if page size not found
                 if printable_height is None:
-                    printable_height = PAGE_SIZES["A4"]["printable_height"]
+                    printable_height = PAGE_SIZES["A4"].printable_height
                     logging.warning(f"[{workbook_name}] {sheet.Name}: Could not determine page size, using A4 defaults")
                 
                 # Account for margins from PageSetup
                 try:
-                    top_margin = sheet.PageSetup.TopMargin
-                    bottom_margin = sheet.PageSetup.BottomMargin
-                    header_margin = sheet.PageSetup.HeaderMargin
-                    footer_margin = sheet.PageSetup.FooterMargin
+                    top_margin = ps.TopMargin
+                    bottom_margin = ps.BottomMargin
+                    header_margin = ps.HeaderMargin
+                    footer_margin = ps.FooterMargin
                     
                     # Adjust printable height by subtracting margins
                     available_height = printable_height - (top_margin + bottom_margin + header_margin + footer_margin)
@@ -1244,7 +1758,7 @@ class ExcelConverter:
                 
             except Exception as e:
                 # Fallback to A4 portrait if page setup reading fails
-                printable_height = PAGE_SIZES["A4"]["printable_height"]
+                printable_height = PAGE_SIZES["A4"].printable_height
                 logging.warning(f"[{workbook_name}] {sheet.Name}: Could not read page setup, using A4 defaults: {e}")
             
             # Page break insertion logic with page range tracking
@@ -1253,6 +1767,8 @@ class ExcelConverter:
             last_break_row = start_row
             page_ranges = []  # Track row ranges for each page
             current_page_start = start_row
+            h_page_breaks = sheet.HPageBreaks
+            sheet_rows = sheet.Rows
             
             # When rows_per_page is set, use ONLY row count (ignore height calculations)
             if rows_per_page:
@@ -1274,9 +1790,8 @@ class ExcelConverter:
                             })
                             
                             try:
-                                sheet.HPageBreaks.Add(Before=sheet.Rows(next_row_index))
+                                h_page_breaks.Add(Before=sheet_rows(next_row_index))
                                 page_count += 1
-                                logging.debug(f"[{workbook_name}] {sheet.Name}: Page break at row {next_row_index} (page {page_count-1}: rows {current_page_start}-{row_index})")
                                 rows_in_current_page = 0
                                 last_break_row = next_row_index
                                 current_page_start = next_row_index
@@ -1299,11 +1814,12 @@ class ExcelConverter:
                 # No rows_per_page limit - use height-based calculation only
                 accumulated_height = 0
                 current_page_rows = 0
+                row_heights = _row_heights(used_range, used_rows)
                 
-                for i in range(used_rows):
+                for i, row_height in enumerate(row_heights):
+                    if row_height is None:
+                        continue
                     try:
-                        row = used_range.Rows(i + 1)
-                        row_height = row.Height
                         row_index = start_row + i
                         current_page_rows += 1
                         
@@ -1319,9 +1835,8 @@ class ExcelConverter:
                             
                             # Insert page break before this row
                             try:
-                                sheet.HPageBreaks.Add(Before=sheet.Rows(row_index))
+                                h_page_breaks.Add(Before=sheet_rows(row_index))
                                 page_count += 1
-                                logging.debug(f"[{workbook_name}] {sheet.Name}: Page break at row {row_index} (page {page_count-1}: rows {current_page_start}-{row_index-1})")
                                 accumulated_height = row_height
                                 last_break_row = row_index
                                 current_page_start = row_index
@@ -1373,27 +1888,27 @@ class ExcelConverter:
             
             # Get current page setup to calculate printable height
             try:
-                page_size_const = sheet.PageSetup.PaperSize
-                orientation = sheet.PageSetup.Orientation
+                ps = sheet.PageSetup
+                page_size_const = ps.PaperSize
+                orientation = ps.Orientation
                 
                 # Find matching page size info
                 printable_height = None
-                for size_name, size_info in PAGE_SIZES.items():
-                    if size_info["xl_const"] == page_size_const:
-                        if orientation == xlLandscape:
-                            # For landscape, swap width and height
-                            printable_height = size_info["width"] - 100  # Account for margins
-                        else:
-                            printable_height = size_info["printable_height"]
-                        break
+                size_info = _PAGE_SIZES_BY_CONST.get(page_size_const)
+                if size_info is not None:
+                    if orientation == xlLandscape:
+                        # For landscape, swap width and height
+                        printable_height = size_info.width - 100  # Account for margins
+                    else:
+                        printable_height = size_info.printable_height
                 
                 # Fallback: use A4 portrait if page size not found
                 if printable_height is None:
-                    printable_height = PAGE_SIZES["A4"]["printable_height"]
+                    printable_height = PAGE_SIZES["A4"].printable_height
                     logging.warning(f"[{workbook_name}] {sheet.Name}: Could not determine page size, using A4 defaults")
                 
             except Exception as e:
-                printable_height = PAGE_SIZES["A4"]["printable_height"]
+                printable_height = PAGE_SIZES["A4"].printable_height
                 logging.warning(f"[{workbook_name}] {sheet.Name}: Could not read page setup, using A4 defaults: {e}")
             
             # Calculate automatic page breaks based on actual row heights
@@ -1402,11 +1917,15 @@ class ExcelConverter:
             page_count = 1
             current_page_start = start_row
             page_ranges = []
+            h_page_breaks = sheet.HPageBreaks
+            sheet_rows = sheet.Rows
+            
+            row_heights = _row_heights(used_range, used_rows)
             
-            for i in range(used_rows):
+            for i, row_height in enumerate(row_heights):
+                if row_height is None:
+                    continue
                 try:
-                    row = used_range.Rows(i + 1)
-                    row_height = row.Height
                     row_index = start_row + i
                     current_page_rows += 1
                     
@@ -1422,9 +1941,8 @@ class ExcelConverter:
                         
                         # Insert page break before this row
                         try:
-                            sheet.HPageBreaks.Add(Before=sheet.Rows(row_index))
+                            h_page_breaks.Add(Before=sheet_rows(row_index))
                             page_count += 1
-                            logging.debug(f"[{workbook_name}] {sheet.Name}: Auto page break at row {row_index}")
                             accumulated_height = row_height
                             current_page_start = row_index
                             current_page_rows = 1
@@ -1464,13 +1982,16 @@ class ExcelConverter:
         Automatically splits content into new pages when column count reaches limit.
         """
         try:
-            used_cols = sheet.UsedRange.Columns.Count
-            start_col = sheet.UsedRange.Column
+            used_range = sheet.UsedRange
+            used_cols = used_range.Columns.Count
+            start_col = used_range.Column
             
             # Insert vertical page breaks at column intervals
+            v_page_breaks = sheet.VPageBreaks
+            sheet_columns = sheet.Columns
             for col in range(start_col + columns_per_page, start_col + used_cols, columns_per_page):
                 try:
-                    sheet.VPageBreaks.Add(Before=sheet.Columns(col))
+                    v_page_breaks.Add(Before=sheet_columns(col))
                 except:
                     pass
             
@@ -1485,44 +2006,35 @@ class ExcelConverter:
         Considers both portrait and landscape orientations.
         Returns the page size name (e.g., 'A4', 'LETTER', etc.)
         """
-        # Sort page sizes by area (smallest first) for efficient selection
-        sorted_sizes = sorted(
-            PAGE_SIZES.items(),
-            key=lambda x: x[1]["width"] * x[1]["height"]
-        )
-        
         # Try to find smallest page that fits content width
         # (height can span multiple pages, but width should fit)
-        for size_name, size_info in sorted_sizes:
-            page_width = size_info["width"]
-            page_height = size_info["height"]
-            
-            # Check portrait orientation
-            if content_width <= page_width:
-                return size_name
-            
-            # Check landscape orientation (swap width/height)
-            if content_width <= page_height:
+        for size_name, size_info in _PAGE_SIZES_BY_AREA:
+            # Check portrait orientation, then landscape (swap width/height)
+            if content_width <= size_info.width or content_width <= size_info.height:
                 return size_name
         
-        # If nothing fits, return largest size (A1)
-        return "A1"
+        # If nothing fits, return the largest size
+        return _PAGE_SIZES_BY_AREA[-1][0]
 
     def _apply_auto_page_size_mode(self, sheet, workbook_name, page_size="A4", orientation='auto'):
         """
         AUTO PAGE SIZE mode - calculate page breaks based on selected page size.
         Supports: auto, letter, tabloid, legal, statement, executive, A1, A2, A3, A4, A5, A6, B4, B5, B6, and more
         """
-        # Get content dimensions first for auto page size detection
+        # Get content dimensions first for auto page size detection; the same
+        # UsedRange is reused for the page break pass below
+        used_range = None
         try:
-            total_width_pts = sheet.UsedRange.Width
-            total_height_pts = sheet.UsedRange.Height
+            used_range = sheet.UsedRange
+            total_width_pts, total_height_pts = used_range.Width, used_range.Height
+            content_size = (total_width_pts, total_height_pts)
         except:
             total_width_pts = 0
             total_height_pts = 0
+            content_size = None
         
         # Auto-detect page size based on content dimensions
-        page_size_upper = page_size.upper() if page_size else "A4"
+        page_size_upper = page_size
         if page_size_upper == "AUTO":
             page_size_upper = self._find_best_page_size(total_width_pts, total_height_pts)
             logging.info(f"[{workbook_name}] {sheet.Name}: Auto-selected {page_size_upper} (content: {total_width_pts:.0f}x{total_height_pts:.0f}pts)")
@@ -1530,36 +2042,32 @@ class ExcelConverter:
         logging.info(f"[{workbook_name}] {sheet.Name}: Applying Auto Page Size mode ({page_size_upper})")
         
         # Get page size info from dictionary, default to A4
-        if page_size_upper in PAGE_SIZES:
-            page_info = PAGE_SIZES[page_size_upper]
-        else:
-            page_info = PAGE_SIZES["A4"]
-            page_size_upper = "A4"
+        page_size_upper, page_info = _page_size_info(page_size_upper)
         
+        ps = sheet.PageSetup
+
         # Set paper size using Excel constant with error handling
         try:
-            sheet.PageSetup.PaperSize = page_info["xl_const"]
+            ps.PaperSize = page_info.xl_const
         except Exception as e:
             # Fallback to A3
-            sheet.PageSetup.PaperSize = xlPaperA3
+            ps.PaperSize = xlPaperA3
             logging.warning(f"[{workbook_name}] {sheet.Name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use C_SHEET, D_SHEET, or E_SHEET.")
             # Update page_info to use fallback
             page_info = PAGE_SIZES["A3"]
         
-        printable_height = page_info["printable_height"]
+        printable_height = page_info.printable_height
         
         # Determine and set orientation
-        page_orientation = self._determine_orientation(sheet, orientation)
-        sheet.PageSetup.Orientation = page_orientation
+        page_orientation = self._determine_orientation(sheet, orientation, content_size)
         
         # For landscape, swap printable height with width
         if page_orientation == xlLandscape:
-            printable_height = page_info["width"] - 100  # Account for margins
+            printable_height = page_info.width - 100  # Account for margins
         
         # Fit width to 1 page
-        sheet.PageSetup.Zoom = False
-        sheet.PageSetup.FitToPagesWide = 1
-        sheet.PageSetup.FitToPagesTall = False
+        with _print_communication_deferred(sheet.Application):
+            _apply_pagesetup(ps, Orientation=page_orientation, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
         
         # Clear existing page breaks
         try:
@@ -1571,111 +2079,121 @@ class ExcelConverter:
         try:
             accumulated_height = 0
             page_count = 1
+            if used_range is None:
+                used_range = sheet.UsedRange
+            start_row = used_range.Row
+            h_page_breaks = sheet.HPageBreaks
+            sheet_rows = sheet.Rows
             
-            for row in sheet.UsedRange.Rows:
-                try:
-                    row_height = row.Height
-                    accumulated_height += row_height
-                    
-                    if accumulated_height > printable_height:
-                        # Insert page break before this row
-                        sheet.HPageBreaks.Add(Before=row)
-                        page_count += 1
-                        accumulated_height = row_height
-                except:
+            for i, row_height in enumerate(_row_heights(used_range, used_range.Rows.Count)):
+                if row_height is None:
                     continue
+                accumulated_height += row_height
+                
+                if accumulated_height > printable_height:
+                    # Insert page break before this row
+                    try:
+                        h_page_breaks.Add(Before=sheet_rows(start_row + i))
+                    except:
+                        continue
+                    page_count += 1
+                    accumulated_height = row_height
             
             logging.info(f"[{workbook_name}] {sheet.Name}: Created {page_count} pages for {page_size}")
         except Exception as e:
             logging.warning(f"Error calculating auto page breaks: {e}")
 
-    def _find_max_content_width(self, workbook):
+    def _find_max_content_width(self, workbook, sizes=None, sheets=None):
         """
         Scan all sheets in the workbook and find the maximum content width.
         Returns (max_width, max_height) in points.
+        If a sizes dict is given, each sheet's (width, height) is stored in it by sheet name.
+        If a sheets list is given, it is used instead of enumerating workbook.Sheets.
         """
         max_width = 0
         max_height = 0
+        workbook_name = workbook.Name
         
-        for sheet in workbook.Sheets:
+        for sheet in sheets if sheets is not None else workbook.Sheets:
+            sheet_name = sheet.Name
             try:
-                width = sheet.UsedRange.Width
-                height = sheet.UsedRange.Height
+                width, height = _used_range_size(sheet)
+                if sizes is not None:
+                    sizes[sheet_name] = (width, height)
                 
                 if width > max_width:
                     max_width = width
                 if height > max_height:
                     max_height = height
                     
-                logging.info(f"[{workbook.Name}] {sheet.Name}: Content size {width:.0f}x{height:.0f}pts")
+                logging.info(f"[{workbook_name}] {sheet_name}: Content size {width:.0f}x{height:.0f}pts")
             except Exception as e:
-                logging.warning(f"Could not get dimensions for sheet {sheet.Name}: {e}")
+                logging.warning(f"Could not get dimensions for sheet {sheet_name}: {e}")
                 continue
         
         return max_width, max_height
 
-    def _apply_uniform_page_size_mode(self, workbook, page_size="auto"):
+    def _apply_uniform_page_size_mode(self, workbook, page_size="AUTO", sheets=None):
         """
         UNIFORM PAGE SIZE mode - find the sheet with largest content width
         and apply that page size to ALL sheets in the workbook.
         
         If page_size is "auto", automatically selects the smallest paper size
         that can fit the widest sheet content.
+        
+        sheets: Optional list of the workbook's sheets, already materialized by the caller
         """
-        logging.info(f"[{workbook.Name}] Applying Uniform Page Size mode")
+        if sheets is None:
+            sheets = list(workbook.Sheets)
+        workbook_name = workbook.Name
+        logging.info(f"[{workbook_name}] Applying Uniform Page Size mode")
         
         # Step 1: Find maximum content width across all sheets
-        max_width, max_height = self._find_max_content_width(workbook)
-        logging.info(f"[{workbook.Name}] Maximum content dimensions: {max_width:.0f}x{max_height:.0f}pts")
+        # Keep each sheet's size so Step 3 does not read UsedRange again
+        sheet_sizes = {}
+        max_width, max_height = self._find_max_content_width(workbook, sheet_sizes, sheets)
+        logging.info(f"[{workbook_name}] Maximum content dimensions: {max_width:.0f}x{max_height:.0f}pts")
         
         # Step 2: Determine page size to use
-        page_size_upper = page_size.upper() if page_size else "AUTO"
+        page_size_upper = page_size
         if page_size_upper == "AUTO":
             page_size_upper = self._find_best_page_size(max_width, max_height)
-            logging.info(f"[{workbook.Name}] Auto-selected page size: {page_size_upper}")
+            logging.info(f"[{workbook_name}] Auto-selected page size: {page_size_upper}")
         
         # Get page info
-        if page_size_upper in PAGE_SIZES:
-            page_info = PAGE_SIZES[page_size_upper]
-        else:
-            page_info = PAGE_SIZES["A4"]
-            page_size_upper = "A4"
+        page_size_upper, page_info = _page_size_info(page_size_upper)
         
-        logging.info(f"[{workbook.Name}] Applying {page_size_upper} to all sheets")
+        logging.info(f"[{workbook_name}] Applying {page_size_upper} to all sheets")
         
         # Step 3: Apply uniform page size to ALL sheets
-        for sheet in workbook.Sheets:
+        for sheet in sheets:
+            sheet_name = sheet.Name
             try:
+                ps = sheet.PageSetup
                 # Set paper size with error handling
                 try:
-                    sheet.PageSetup.PaperSize = page_info["xl_const"]
+                    ps.PaperSize = page_info.xl_const
                 except Exception as e:
                     # Fallback to A3
-                    sheet.PageSetup.PaperSize = xlPaperA3
-                    logging.warning(f"[{workbook.Name}] {sheet.Name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use C_SHEET, D_SHEET, or E_SHEET.")
+                    ps.PaperSize = xlPaperA3
+                    logging.warning(f"[{workbook_name}] {sheet_name}: Paper size '{page_size_upper}' not supported, using A3. For large formats, use C_SHEET, D_SHEET, or E_SHEET.")
                     # Update page_info to use fallback
                     page_info = PAGE_SIZES["A3"]
                 
                 # Get sheet's own dimensions for orientation
-                try:
-                    sheet_width = sheet.UsedRange.Width
-                    sheet_height = sheet.UsedRange.Height
-                except:
-                    sheet_width = 0
-                    sheet_height = 0
+                sheet_width, sheet_height = sheet_sizes.get(sheet_name, (0, 0))
                 
                 # Set orientation based on content
                 if sheet_width > sheet_height:
-                    sheet.PageSetup.Orientation = xlLandscape
-                    printable_height = page_info["width"] - 100
+                    page_orientation = xlLandscape
+                    printable_height = page_info.width - 100
                 else:
-                    sheet.PageSetup.Orientation = xlPortrait
-                    printable_height = page_info["printable_height"]
+                    page_orientation = xlPortrait
+                    printable_height = page_info.printable_height
                 
                 # Fit width to 1 page
-                sheet.PageSetup.Zoom = False
-                sheet.PageSetup.FitToPagesWide = 1
-                sheet.PageSetup.FitToPagesTall = False
+                with _print_communication_deferred(sheet.Application):
+                    _apply_pagesetup(ps, Orientation=page_orientation, Zoom=False, FitToPagesWide=1, FitToPagesTall=False)
                 
                 # Set print area to used range only (removes white space)
                 try:
@@ -1683,7 +2201,7 @@ class ExcelConverter:
                     self._adjust_usedrange_for_images(sheet, workbook_name)
                 except Exception:
                     try:
-                        sheet.PageSetup.PrintArea = sheet.UsedRange.Address
+                        _apply_pagesetup(ps, PrintArea=sheet.UsedRange.Address)
                     except:
                         pass
                 
@@ -1696,23 +2214,28 @@ class ExcelConverter:
                 # Calculate and insert page breaks based on row heights
                 accumulated_height = 0
                 page_count = 1
+                used_range = sheet.UsedRange
+                start_row = used_range.Row
+                h_page_breaks = sheet.HPageBreaks
+                sheet_rows = sheet.Rows
                 
-                for row in sheet.UsedRange.Rows:
-                    try:
-                        row_height = row.Height
-                        accumulated_height += row_height
-                        
-                        if accumulated_height > printable_height:
-                            sheet.HPageBreaks.Add(Before=row)
-                            page_count += 1
-                            accumulated_height = row_height
-                    except:
+                for i, row_height in enumerate(_row_heights(used_range, used_range.Rows.Count)):
+                    if row_height is None:
                         continue
+                    accumulated_height += row_height
+                    
+                    if accumulated_height > printable_height:
+                        try:
+                            h_page_breaks.Add(Before=sheet_rows(start_row + i))
+                        except:
+                            continue
+                        page_count += 1
+                        accumulated_height = row_height
                 
-                logging.info(f"[{workbook.Name}] {sheet.Name}: Applied {page_size_upper}, {page_count} pages")
+                logging.info(f"[{workbook_name}] {sheet_name}: Applied {page_size_upper}, {page_count} pages")
                 
             except Exception as e:
-                logging.warning(f"Could not apply uniform page size to sheet {sheet.Name}: {e}")
+                logging.warning(f"Could not apply uniform page size to sheet {sheet_name}: {e}")
 
     def _setup_header_footer(self, sheet, workbook_name, print_options=None, page_ranges=None):
         """
@@ -1726,23 +2249,22 @@ class ExcelConverter:
             # Get used range info for row tracking
             used_range = sheet.UsedRange
             start_row = used_range.Row
-            end_row = start_row + used_range.Rows.Count - 1
             total_rows = used_range.Rows.Count
-            
-            # Clear all header/footer sections first
-            sheet.PageSetup.LeftHeader = ""
-            sheet.PageSetup.RightHeader = ""
-            sheet.PageSetup.LeftFooter = ""
-            sheet.PageSetup.RightFooter = ""
-            sheet.PageSetup.CenterFooter = ""
+            end_row = start_row + total_rows - 1
             
             # Get rows_per_page setting for accurate row tracking
             rows_per_page = None
             if print_options:
-                rows_per_page = print_options.get('rows_per_page')
+                rows_per_page = print_options.rows_per_page
             
-            # Setup enhanced header with all metadata (moved from footer for PDF trimming)
-            self._setup_enhanced_header(sheet, workbook_name, start_row, end_row, total_rows, rows_per_page, page_ranges)
+            ps = sheet.PageSetup
+            with _print_communication_deferred(sheet.Application):
+                # Clear the footer sections; the header sections are all written below
+                # Sections that are already empty are not written again
+                _apply_pagesetup(ps, LeftFooter="", CenterFooter="", RightFooter="")
+                
+                # Setup enhanced header with all metadata (moved from footer for PDF trimming)
+                self._setup_enhanced_header(sheet, workbook_name, start_row, end_row, total_rows, rows_per_page, page_ranges)
             
             logging.info(f"[{workbook_name}] {sheet.Name}: Set enhanced header with metadata (Rows {start_row}-{end_row}, rows_per_page: {rows_per_page})")
             
@@ -1755,8 +2277,9 @@ class ExcelConverter:
         All metadata moved to header to prevent loss during PDF trimming.
         """
         try:
+            # Build all header strings first, then write them through a single PageSetup handle
             # LEFT HEADER: Sheet name with better formatting
-            sheet.PageSetup.LeftHeader = f"&\"Arial,Bold\"&L{sheet.Name}"
+            left_text = f"&\"Arial,Bold\"&L{sheet.Name}"
             
             # CENTER HEADER: Enhanced row tracking with page-specific information
             if rows_per_page and rows_per_page > 0:
@@ -1770,10 +2293,11 @@ class ExcelConverter:
                 # Auto-break or single-page sheets
                 center_text = f"&\"Arial\"&CRows: {start_row}-{end_row} ({total_rows} total rows)"
             
-            sheet.PageSetup.CenterHeader = center_text
-            
             # RIGHT HEADER: Page information (moved from footer for PDF trimming safety)
-            sheet.PageSetup.RightHeader = f"&\"Arial\"&RPage &P of &N"
+            right_text = "&\"Arial\"&RPage &P of &N"
+            
+            with _print_communication_deferred(sheet.Application):
+                _apply_pagesetup(sheet.PageSetup, LeftHeader=left_text, CenterHeader=center_text, RightHeader=right_text)
             
             # Log page ranges for reference (helps with tracking original file locations)
             if page_ranges and len(page_ranges) > 1:
@@ -1791,12 +2315,9 @@ class ExcelConverter:
         Clear all header and footer content from the sheet.
         """
         try:
-            sheet.PageSetup.LeftHeader = ""
-            sheet.PageSetup.CenterHeader = ""
-            sheet.PageSetup.RightHeader = ""
-            sheet.PageSetup.LeftFooter = ""
-            sheet.PageSetup.CenterFooter = ""
-            sheet.PageSetup.RightFooter = ""
+            ps = sheet.PageSetup
+            with _print_communication_deferred(sheet.Application):
+                _apply_pagesetup(ps, **dict.fromkeys(HEADER_FOOTER_SECTIONS, ""))
             logging.info(f"[{workbook_name}] {sheet.Name}: Cleared header/footer")
         except Exception as e:
             logging.warning(f"Could not clear header/footer for {sheet.Name}: {e}")
@@ -1807,7 +2328,7 @@ class ExcelConverter:
         and column letters (A,B,C...) on top of the printed page.
         """
         try:
-            sheet.PageSetup.PrintHeadings = enable
+            _apply_pagesetup(sheet.PageSetup, PrintHeadings=enable)
             if enable:
                 logging.info(f"[{workbook_name}] {sheet.Name}: Enabled row/column headings")
             else:
@@ -1821,44 +2342,38 @@ class ExcelConverter:
         This is the reliable method that works without dialogs.
         Enhanced handling for multiple images and embedded objects.
         """
-        logging.info(f"[{workbook.Name}] Exporting to PDF: {output_path}")
+        workbook_name = workbook.Name
+        logging.info(f"[{workbook_name}] Exporting to PDF: {output_path}")
         
         try:
             # Ensure output path is absolute and properly formatted
-            output_path = str(Path(output_path).resolve())
-            
-            # Additional COM initialization for PDF export reliability
-            try:
-                import pythoncom
-                pythoncom.CoInitialize()
-            except:
-                pass
+            output_path = os.path.abspath(output_path)
             
             # Pre-export analysis and preparation
             try:
                 prep_info = self._prepare_workbook_for_export(workbook)
-                logging.info(f"[{workbook.Name}] Pre-export analysis: {prep_info['total_shapes']} shapes, {prep_info['problem_shapes']} problematic, {len(prep_info['multi_image_rows'])} multi-image rows")
+                logging.info(f"[{workbook_name}] Pre-export analysis: {prep_info['total_shapes']} shapes, {prep_info['problem_shapes']} problematic, {len(prep_info['multi_image_rows'])} multi-image rows")
             except Exception as e:
-                logging.warning(f"[{workbook.Name}] Warning during export preparation: {e}")
+                logging.warning(f"[{workbook_name}] Warning during export preparation: {e}")
                 prep_info = {'total_shapes': 0, 'problem_shapes': 0, 'multi_image_rows': {}}
             
             # Try standard export first
-            logging.info(f"[{workbook.Name}] Attempting standard PDF export...")
+            logging.info(f"[{workbook_name}] Attempting standard PDF export...")
             workbook.ExportAsFixedFormat(
                 Type=xlTypePDF,
                 Filename=output_path,
-                Quality=xlQualityStandard,
+                Quality=self._pdf_quality,
                 IncludeDocProperties=True,
                 IgnorePrintAreas=False,
                 OpenAfterPublish=False
             )
             
             # Verify output file was created
-            if Path(output_path).exists() and Path(output_path).stat().st_size > 0:
-                file_size = Path(output_path).stat().st_size
-                logging.info(f"[{workbook.Name}] PDF export completed successfully: {output_path} ({file_size} bytes)")
+            file_size = _file_size(output_path)
+            if file_size > 0:
+                logging.info(f"[{workbook_name}] PDF export completed successfully: {output_path} ({file_size} bytes)")
             else:
-                logging.error(f"[{workbook.Name}] PDF file was not created or is empty: {output_path}")
+                logging.error(f"[{workbook_name}] PDF file was not created or is empty: {output_path}")
                 raise Exception(f"ExportAsFixedFormat did not create output file: {output_path}")
                 
         except Exception as e:
@@ -1873,21 +2388,21 @@ class ExcelConverter:
                 
                 # Detailed error analysis
                 if prep_info['multi_image_rows']:
-                    logging.error(f"[{workbook.Name}] PDF export failed: Multiple images in single rows detected")
+                    logging.error(f"[{workbook_name}] PDF export failed: Multiple images in single rows detected")
                     logging.error("Problematic rows with multiple images:")
                     for row_info, shapes in prep_info['multi_image_rows'].items():
                         logging.error(f"  - {row_info}: {len(shapes)} images")
                 elif prep_info['problem_shapes'] > 0:
-                    logging.error(f"[{workbook.Name}] PDF export failed: {prep_info['problem_shapes']} problematic embedded objects detected")
+                    logging.error(f"[{workbook_name}] PDF export failed: {prep_info['problem_shapes']} problematic embedded objects detected")
                 else:
-                    logging.error(f"[{workbook.Name}] PDF export failed: File contains embedded objects/images that cannot be exported")
+                    logging.error(f"[{workbook_name}] PDF export failed: File contains embedded objects/images that cannot be exported")
                 
                 # Try recovery methods
                 logging.error("Attempting recovery methods...")
                 
                 try:
                     # Method 1: Save and reload approach
-                    logging.info(f"[{workbook.Name}] Recovery Method 1: Save-and-reload approach")
+                    logging.info(f"[{workbook_name}] Recovery Method 1: Save-and-reload approach")
                     self._export_with_recovery(workbook, output_path)
                     return  # Success with recovery method
                 except Exception as recovery1_error:
@@ -1895,7 +2410,7 @@ class ExcelConverter:
                 
                 try:
                     # Method 2: Shape optimization approach
-                    logging.info(f"[{workbook.Name}] Recovery Method 2: Shape optimization approach")
+                    logging.info(f"[{workbook_name}] Recovery Method 2: Shape optimization approach")
                     self._export_with_shape_optimization(workbook, output_path, prep_info)
                     return  # Success with shape optimization
                 except Exception as recovery2_error:
@@ -1930,6 +2445,7 @@ class ExcelConverter:
         Prepare workbook for PDF export by handling potential issues with embedded objects/images.
         Enhanced handling for multiple images in single rows.
         """
+        workbook_name = workbook.Name
         try:
             total_shapes = 0
             problem_shapes = 0
@@ -1942,7 +2458,7 @@ class ExcelConverter:
                     sheet_problems = 0
                     row_image_count = {}
                     
-                    logging.info(f"[{workbook.Name}] {sheet.Name}: Analyzing shapes/images for export preparation...")
+                    logging.info(f"[{workbook_name}] {sheet.Name}: Analyzing shapes/images for export preparation...")
                     
                     # Count and analyze shapes per row
                     for shape in sheet.Shapes:
@@ -1979,7 +2495,7 @@ class ExcelConverter:
                             if shape_type in [13, 14, 15]:  # OLE objects, embedded objects, linked objects
                                 sheet_problems += 1
                                 problem_shapes += 1
-                                logging.warning(f"[{workbook.Name}] {sheet.Name}: Found potentially problematic shape '{shape_name}' (Type: {shape_type}) that may cause export issues")
+                                logging.warning(f"[{workbook_name}] {sheet.Name}: Found potentially problematic shape '{shape_name}' (Type: {shape_type}) that may cause export issues")
                                 
                         except Exception as shape_error:
                             logging.debug(f"Error analyzing shape: {shape_error}")
@@ -1989,12 +2505,12 @@ class ExcelConverter:
                     for row_num, shapes_in_row in row_image_count.items():
                         if len(shapes_in_row) > 1:
                             multi_image_rows[f"{sheet.Name}_Row_{row_num}"] = shapes_in_row
-                            logging.warning(f"[{workbook.Name}] {sheet.Name}: Row {row_num} contains {len(shapes_in_row)} images/objects:")
+                            logging.warning(f"[{workbook_name}] {sheet.Name}: Row {row_num} contains {len(shapes_in_row)} images/objects:")
                             for i, shape_info in enumerate(shapes_in_row, 1):
                                 logging.warning(f"  {i}. '{shape_info['name']}' (Type: {shape_info['type']})")
                     
                     if sheet_shapes > 0:
-                        logging.info(f"[{workbook.Name}] {sheet.Name}: Found {sheet_shapes} shapes/images ({sheet_problems} potentially problematic)")
+                        logging.info(f"[{workbook_name}] {sheet.Name}: Found {sheet_shapes} shapes/images ({sheet_problems} potentially problematic)")
                     
                 except Exception as sheet_error:
                     logging.warning(f"Error analyzing sheet {sheet.Name}: {sheet_error}")
@@ -2002,19 +2518,19 @@ class ExcelConverter:
             
             # Log summary
             if total_shapes > 0:
-                logging.info(f"[{workbook.Name}] Total shapes/images: {total_shapes} ({problem_shapes} potentially problematic)")
+                logging.info(f"[{workbook_name}] Total shapes/images: {total_shapes} ({problem_shapes} potentially problematic)")
                 
             if multi_image_rows:
-                logging.warning(f"[{workbook.Name}] Found {len(multi_image_rows)} rows with multiple images - this may cause export issues")
+                logging.warning(f"[{workbook_name}] Found {len(multi_image_rows)} rows with multiple images - this may cause export issues")
                 
             # Force calculate all formulas to avoid calculation issues during export
             try:
                 workbook.Application.CalculateFullRebuild()
-                logging.debug(f"[{workbook.Name}] Force-calculated all formulas for export stability")
+                logging.debug(f"[{workbook_name}] Force-calculated all formulas for export stability")
             except:
                 try:
                     workbook.Application.Calculate()
-                    logging.debug(f"[{workbook.Name}] Calculated formulas for export stability")
+                    logging.debug(f"[{workbook_name}] Calculated formulas for export stability")
                 except:
                     pass
                     
@@ -2040,7 +2556,8 @@ class ExcelConverter:
             temp_name = f"temp_export_{int(time.time())}_{os.getpid()}.xlsx"
             temp_file = os.path.join(temp_dir, temp_name)
             
-            logging.info(f"[{workbook.Name}] Saving to temporary file for recovery export: {temp_file}")
+            workbook_name = workbook.Name
+            logging.info(f"[{workbook_name}] Saving to temporary file for recovery export: {temp_file}")
             
             # Save workbook to temporary file (this often resolves embedded object issues)
             workbook.SaveAs(temp_file, FileFormat=51)  # 51 = xlOpenXMLWorkbook (.xlsx)
@@ -2052,16 +2569,16 @@ class ExcelConverter:
             workbook.ExportAsFixedFormat(
                 Type=xlTypePDF,
                 Filename=output_path,
-                Quality=xlQualityStandard,
+                Quality=self._pdf_quality,
                 IncludeDocProperties=True,
                 IgnorePrintAreas=False,
                 OpenAfterPublish=False
             )
             
             # Verify output file was created
-            if Path(output_path).exists() and Path(output_path).stat().st_size > 0:
-                file_size = Path(output_path).stat().st_size
-                logging.info(f"[{workbook.Name}] PDF export completed with recovery method: {output_path} ({file_size} bytes)")
+            file_size = _file_size(output_path)
+            if file_size > 0:
+                logging.info(f"[{workbook_name}] PDF export completed with recovery method: {output_path} ({file_size} bytes)")
             else:
                 raise Exception("Recovery export did not create output file")
                 
@@ -2082,8 +2599,9 @@ class ExcelConverter:
         Advanced recovery method specifically for handling multiple images and complex shapes.
         Attempts to optimize shape positioning and properties before export.
         """
+        workbook_name = workbook.Name
         try:
-            logging.info(f"[{workbook.Name}] Applying shape optimization for {prep_info['total_shapes']} shapes...")
+            logging.info(f"[{workbook_name}] Applying shape optimization for {prep_info['total_shapes']} shapes...")
             
             shapes_optimized = 0
             rows_processed = 0
@@ -2110,7 +2628,7 @@ class ExcelConverter:
                     for row_num, shapes_in_row in row_shapes.items():
                         if len(shapes_in_row) > 1:
                             rows_processed += 1
-                            logging.info(f"[{workbook.Name}] {sheet.Name}: Optimizing Row {row_num} with {len(shapes_in_row)} images")
+                            logging.info(f"[{workbook_name}] {sheet.Name}: Optimizing Row {row_num} with {len(shapes_in_row)} images")
                             
                             # Try to optimize each shape in the problematic row
                             for i, shape in enumerate(shapes_in_row):
@@ -2139,13 +2657,13 @@ class ExcelConverter:
                                     continue
                     
                     if sheet_optimized > 0:
-                        logging.info(f"[{workbook.Name}] {sheet.Name}: Optimized {sheet_optimized} shapes")
+                        logging.info(f"[{workbook_name}] {sheet.Name}: Optimized {sheet_optimized} shapes")
                         
                 except Exception as sheet_error:
                     logging.warning(f"Error optimizing shapes in sheet {sheet.Name}: {sheet_error}")
                     continue
             
-            logging.info(f"[{workbook.Name}] Shape optimization completed: {shapes_optimized} shapes optimized in {rows_processed} multi-image rows")
+            logging.info(f"[{workbook_name}] Shape optimization completed: {shapes_optimized} shapes optimized in {rows_processed} multi-image rows")
             
             # Force recalculation after optimization
             try:
@@ -2155,28 +2673,23 @@ class ExcelConverter:
                 pass
             
             # Now attempt export with optimized shapes
-            logging.info(f"[{workbook.Name}] Attempting PDF export with optimized shapes...")
+            logging.info(f"[{workbook_name}] Attempting PDF export with optimized shapes...")
             workbook.ExportAsFixedFormat(
                 Type=xlTypePDF,
                 Filename=output_path,
-                Quality=xlQualityStandard,
+                Quality=self._pdf_quality,
                 IncludeDocProperties=True,
                 IgnorePrintAreas=False,
                 OpenAfterPublish=False
             )
             
             # Verify output file was created
-            if Path(output_path).exists() and Path(output_path).stat().st_size > 0:
-                file_size = Path(output_path).stat().st_size
-                logging.info(f"[{workbook.Name}] PDF export completed with shape optimization: {output_path} ({file_size} bytes)")
+            file_size = _file_size(output_path)
+            if file_size > 0:
+                logging.info(f"[{workbook_name}] PDF export completed with shape optimization: {output_path} ({file_size} bytes)")
             else:
                 raise Exception("Shape optimization export did not create output file")
                 
         except Exception as e:
             logging.error(f"Shape optimization export method failed: {e}")
             raise
-
-    def _autofit_merged_cells(self, sheet, workbook_name):
-        """DISABLED: Preserves original merged cell heights."""
-        logging.info(f"[{workbook_name}] {sheet.Name}: Preserving original merged cell layout")
-
@@ -0,0 +1,64 @@
+"""
+Print Options Module
+
+Resolves one `print_options` entry from config.yaml into a fixed set of
+attributes with defaults applied, so the converter reads plain attributes
+per sheet instead of repeating `dict.get(key, default)` lookups.
+"""
+
+from typing import Optional, Dict, Any
+
+
+def _normalize_choice(value: Any, default: str) -> str:
+    """
+    Lower-case a keyword option (orientation, scaling, margins) once at load time,
+    falling back to the default when it is missing or empty.
+    """
+    return str(value).lower() if value else default
+
+
+class PrintOptions:
+    """
+    Print settings for the sheets matched by one `print_options` config entry.
+    """
+
+    __slots__ = (
+        'sheets',
+        'priority',
+        'mode',
+        'page_size',
+        'orientation',
+        'rows_per_page',
+        'columns_per_page',
+        'scaling',
+        'scaling_percent',
+        'margins',
+        'custom_margins',
+        'print_header_footer',
+        'print_row_col_headings',
+    )
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize PrintOptions from a single print_options config entry.
+
+        Args:
+            config: One print_options dictionary from config.yaml
+        """
+        config = config or {}
+
+        self.sheets = config.get('sheets', None)
+        self.priority = config.get('priority', 999)
+        # None means "use the workbook-level print mode"
+        self.mode = config.get('mode', None)
+        # Upper-cased once here so it can be used directly as a PAGE_SIZES key
+        self.page_size = str(config.get('page_size') or 'A4').upper()
+        self.orientation = _normalize_choice(config.get('orientation'), 'auto')
+        self.rows_per_page = config.get('rows_per_page')
+        self.columns_per_page = config.get('columns_per_page')
+        self.scaling = _normalize_choice(config.get('scaling'), 'fit_columns')
+        self.scaling_percent = config.get('scaling_percent', 100)
+        self.margins = _normalize_choice(config.get('margins'), 'normal')
+        self.custom_margins = config.get('custom_margins', {})
+        self.print_header_footer = config.get('print_header_footer', True)
+        self.print_row_col_headings = config.get('print_row_col_headings', False)